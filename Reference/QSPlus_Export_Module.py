@@ -17,44 +17,92 @@ Version: 1.0
 
 import csv
 import json
+import os
+from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Dict, Optional, Union
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
-
 
+# Item columns in export order, as display keys and the matching BOQItem
+# attributes. The first _BASIC_COLUMNS are always exported; the remainder
+# are the calculation columns controlled by include_calculations.
+_BOQ_KEYS = (
+    'Item Number', 'Section', 'Subsection', 'Description',
+    'Unit', 'Quantity', 'Rate', 'Amount',
+    'Calculation Notes', 'Reference Drawing', 'Measurement Rule'
+)
+_BOQ_ATTRS = (
+    'item_number', 'section', 'subsection', 'description',
+    'unit', 'quantity', 'rate', 'amount',
+    'calculation_notes', 'reference_drawing', 'measurement_rule'
+)
+_BASIC_COLUMNS = 8
+_BOQ_GETTER = attrgetter(*_BOQ_ATTRS)
+_BOQ_BASIC_GETTER = attrgetter(*_BOQ_ATTRS[:_BASIC_COLUMNS])
+
+
+def _escape_xml(text: str) -> str:
+    """Escape &, < and > in XML character data, as xml.sax.saxutils.escape does"""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+# XML element names for the item columns, and the precomputed open, close and
+# empty tag fragments (at item field depth) used to emit each one directly.
+# Text columns are escaped; the numeric columns only need str().
+_XML_TAGS = (
+    'ItemNumber', 'Section', 'Subsection', 'Description',
+    'Unit', 'Quantity', 'Rate', 'Amount',
+    'CalculationNotes', 'ReferenceDrawing', 'MeasurementRule'
+)
+_XML_ITEM_FIELDS = tuple(
+    (f'\n      <{tag}>', f'</{tag}>', f'\n      <{tag}/>') for tag in _XML_TAGS
+)
+_XML_CONVERTERS = (_escape_xml,) * 5 + (str,) * 3 + (_escape_xml,) * 3
+
+# Software details recorded in the metadata of every export
+_SOFTWARE_NAME = 'DELLQS-AI'
+_SOFTWARE_VERSION = '1.0'
+
+# Write buffer size for exported files; large BOQs are written in few syscalls
+_WRITE_BUFFER = 1 << 20
+
+# Exporter method and file extension for each format handled by export_all
+_EXPORT_FORMATS = {
+    'excel': ('export_to_excel', 'xlsx'),
+    'csv': ('export_to_csv', 'csv'),
+    'xml': ('export_to_xml', 'xml'),
+    'json': ('export_to_json', 'json'),
+}
+
+
+# eq=False keeps the original class's identity comparison and hashing, so
+# items can go in sets and dict keys and list.remove() removes that item
+@dataclass(slots=True, eq=False)
 class BOQItem:
     """Represents a single item in the Bill of Quantities"""
 
-    def __init__(
-        self,
-        item_number: str,
-        description: str,
-        unit: str,
-        quantity: float = 0.0,
-        rate: float = 0.0,
-        amount: float = 0.0,
-        section: str = "",
-        subsection: str = "",
-        calculation_notes: str = "",
-        reference_drawing: str = "",
-        measurement_rule: str = ""
-    ):
-        self.item_number = item_number
-        self.description = description
-        self.unit = unit
-        self.quantity = quantity
-        self.rate = rate
-        self.amount = amount if amount > 0 else (quantity * rate)
-        self.section = section
-        self.subsection = subsection
-        self.calculation_notes = calculation_notes
-        self.reference_drawing = reference_drawing
-        self.measurement_rule = measurement_rule
+    item_number: str
+    description: str
+    unit: str
+    quantity: float = 0.0
+    rate: float = 0.0
+    amount: float = 0.0
+    section: str = ""
+    subsection: str = ""
+    calculation_notes: str = ""
+    reference_drawing: str = ""
+    measurement_rule: str = ""
+
+    def __post_init__(self):
+        # Derive the amount from quantity x rate when none is given
+        if self.amount <= 0:
+            self.amount = self.quantity * self.rate
 
     def to_dict(self) -> Dict:
         """Convert BOQ item to dictionary"""
+        # Spelled out field by field (keys as in _BOQ_KEYS); a literal is
+        # several times faster than building the dict from the key tuple
         return {
             'Item Number': self.item_number,
             'Section': self.section,
@@ -69,20 +117,96 @@ class BOQItem:
             'Measurement Rule': self.measurement_rule
         }
 
+    def _to_basic_dict(self) -> Dict:
+        """Convert BOQ item to dictionary without the calculation columns"""
+        return {
+            'Item Number': self.item_number,
+            'Section': self.section,
+            'Subsection': self.subsection,
+            'Description': self.description,
+            'Unit': self.unit,
+            'Quantity': self.quantity,
+            'Rate': self.rate,
+            'Amount': self.amount
+        }
+
+
+def _write_csv_rows(csvfile, writer, rows, column_count: int, batch_size: int = 4096):
+    """
+    Write CSV data rows, joining plain rows directly and batching the writes
+
+    Rows with no delimiter, quote or line break in any field (and no None
+    values) need no quoting, so they are joined with str.join and written in
+    batches. Any other row is passed to the csv writer, which keeps the output
+    identical to writing every row through csv.writer.
+    """
+    terminator = writer.dialect.lineterminator
+    separators = column_count - 1
+    buffer = []
+
+    for row in rows:
+        line = ','.join(map(str, row))
+        if (line.count(',') == separators and '"' not in line
+                and '\n' not in line and '\r' not in line and None not in row):
+            buffer.append(line + terminator)
+            if len(buffer) >= batch_size:
+                csvfile.writelines(buffer)
+                buffer.clear()
+        else:
+            if buffer:
+                csvfile.writelines(buffer)
+                buffer.clear()
+            writer.writerow(row)
+
+    csvfile.writelines(buffer)
+
+
+def _to_cents(amount: float) -> int:
+    """Round an amount to a whole number of cents, halves away from zero"""
+    cents = int(abs(amount) * 100 + 0.5)
+    return -cents if amount < 0 else cents
+
+
+def _format_cents(cents: int) -> str:
+    """Format a cents total as a decimal amount with two places"""
+    sign = '-' if cents < 0 else ''
+    units, cents = divmod(abs(cents), 100)
+    return f'{sign}{units}.{cents:02d}'
+
+
+def _sync_file(f):
+    """Flush an open file's buffers and force its contents to disk"""
+    f.flush()
+    os.fsync(f.fileno())
+
 
 class QSPlusExporter:
     """Main class for exporting BOQ data to QSPlus-compatible formats"""
 
-    def __init__(self, project_name: str = "", project_number: str = ""):
+    def __init__(self, project_name: str = "", project_number: str = "", durable: bool = False):
         self.project_name = project_name
         self.project_number = project_number
+        # When set, each export is fsynced to disk before it returns
+        self.durable = durable
         self.items: List[BOQItem] = []
         self.metadata = {
-            'created_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'software': 'DELLQS-AI',
-            'version': '1.0'
+            'created_date': datetime.now().isoformat(sep=' ', timespec='seconds'),
+            'software': _SOFTWARE_NAME,
+            'version': _SOFTWARE_VERSION
         }
 
+    @property
+    def total_amount(self) -> float:
+        """Total of all item amounts, summed from the current items"""
+        return self._total_cents() / 100
+
+    def _total_cents(self) -> int:
+        """Sum the current item amounts exactly, in whole cents"""
+        # Summed on every call: items is a public list of mutable BOQItems,
+        # so a total kept up to date in add_item would go stale. Rounding
+        # each amount to cents keeps float summation error out of the total
+        return sum(_to_cents(item.amount) for item in self.items)
+
     def add_item(self, item: BOQItem):
         """Add a BOQ item to the export"""
         self.items.append(item)
@@ -109,47 +233,41 @@ class QSPlusExporter:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Define headers based on include_calculations flag
+        # Define headers and matching item attributes based on include_calculations flag
         if include_calculations:
-            headers = [
-                'Item Number', 'Section', 'Subsection', 'Description',
-                'Unit', 'Quantity', 'Rate', 'Amount',
-                'Calculation Notes', 'Reference Drawing', 'Measurement Rule'
-            ]
+            headers = list(_BOQ_KEYS)
+            getter = _BOQ_GETTER
         else:
-            headers = [
-                'Item Number', 'Section', 'Subsection', 'Description',
-                'Unit', 'Quantity', 'Rate', 'Amount'
-            ]
+            headers = list(_BOQ_KEYS[:_BASIC_COLUMNS])
+            getter = _BOQ_BASIC_GETTER
 
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
+        padding = [''] * (len(headers) - 1)
+        blank_row = [''] * len(headers)
+
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER) as csvfile:
+            writer = csv.writer(csvfile)
 
             # Write header section
-            writer.writerow({headers[0]: f'Project: {self.project_name}'})
-            writer.writerow({headers[0]: f'Project Number: {self.project_number}'})
-            writer.writerow({headers[0]: f'Date: {self.metadata["created_date"]}'})
-            writer.writerow({headers[0]: f'Software: {self.metadata["software"]}'})
-            writer.writerow({})  # Blank line
+            writer.writerow([f'Project: {self.project_name}', *padding])
+            writer.writerow([f'Project Number: {self.project_number}', *padding])
+            writer.writerow([f'Date: {self.metadata["created_date"]}', *padding])
+            writer.writerow([f'Software: {self.metadata["software"]}', *padding])
+            writer.writerow(blank_row)
 
             # Write column headers
-            writer.writeheader()
+            writer.writerow(headers)
 
             # Write data rows
-            for item in self.items:
-                row_data = item.to_dict()
-                if not include_calculations:
-                    # Remove calculation-related fields
-                    row_data = {k: v for k, v in row_data.items() if k in headers}
-                writer.writerow(row_data)
+            _write_csv_rows(csvfile, writer, map(getter, self.items), len(headers))
 
             # Write summary section
-            total_amount = sum(item.amount for item in self.items)
-            writer.writerow({})  # Blank line
-            writer.writerow({
-                'Description': 'TOTAL',
-                'Amount': f'{total_amount:.2f}'
-            })
+            total_row = list(blank_row)
+            total_row[headers.index('Description')] = 'TOTAL'
+            total_row[headers.index('Amount')] = _format_cents(self._total_cents())
+            writer.writerow(blank_row)
+            writer.writerow(total_row)
+            if self.durable:
+                _sync_file(csvfile)
 
         return str(output_file)
 
@@ -165,57 +283,40 @@ class QSPlusExporter:
             Path to the created Excel file
         """
         try:
-            import openpyxl
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+            import xlsxwriter
         except ImportError:
             raise ImportError(
-                "openpyxl is required for Excel export. "
-                "Install it with: pip install openpyxl"
+                "XlsxWriter is required for Excel export. "
+                "Install it with: pip install XlsxWriter"
             )
 
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create workbook and select active sheet
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Bill of Quantities"
-
-        # Define styles
-        header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-        header_font = Font(bold=True, color='FFFFFF', size=11)
-        title_font = Font(bold=True, size=14)
-        section_fill = PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid')
-        section_font = Font(bold=True, size=11)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-
-        # Write project information
-        row = 1
-        ws.merge_cells(f'A{row}:H{row}')
-        cell = ws[f'A{row}']
-        cell.value = f'BILL OF QUANTITIES - {self.project_name}'
-        cell.font = title_font
-
-        row += 1
-        ws[f'A{row}'] = f'Project Number:'
-        ws[f'B{row}'] = self.project_number
-
-        row += 1
-        ws[f'A{row}'] = f'Date:'
-        ws[f'B{row}'] = self.metadata['created_date']
-
-        row += 1
-        ws[f'A{row}'] = f'Generated by:'
-        ws[f'B{row}'] = self.metadata['software']
-
-        row += 2  # Blank line
-
-        # Write column headers
+        # Create workbook in constant_memory mode so rows are streamed to disk
+        # as they are written rather than held in memory
+        wb = xlsxwriter.Workbook(str(output_file), {'constant_memory': True})
+        ws = wb.add_worksheet("Bill of Quantities")
+
+        # Define formats once; cells share them by reference
+        title_fmt = wb.add_format({'bold': True, 'font_size': 14})
+        header_fmt = wb.add_format({
+            'bold': True, 'font_color': '#FFFFFF', 'font_size': 11,
+            'bg_color': '#366092', 'align': 'center', 'valign': 'vcenter',
+            'border': 1
+        })
+        section_fmt = wb.add_format({
+            'bold': True, 'font_size': 11, 'bg_color': '#D9E1F2',
+            'align': 'left', 'valign': 'vcenter'
+        })
+        text_fmt = wb.add_format({'border': 1})
+        num_fmt = wb.add_format({'num_format': '#,##0.00', 'align': 'right', 'border': 1})
+        total_label_fmt = wb.add_format({'bold': True, 'font_size': 11, 'align': 'right'})
+        total_fmt = wb.add_format({
+            'bold': True, 'font_size': 11, 'num_format': '#,##0.00', 'border': 1
+        })
+
+        # Column headers
         if include_calculations:
             headers = [
                 'Item No.', 'Section', 'Subsection', 'Description',
@@ -230,85 +331,81 @@ class QSPlusExporter:
             ]
             col_widths = [10, 20, 20, 50, 10, 12, 12, 15]
 
-        for col, (header, width) in enumerate(zip(headers, col_widths), start=1):
-            cell = ws.cell(row=row, column=col)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = border
-            ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
+        for col, width in enumerate(col_widths):
+            ws.set_column(col, col, width)
+
+        # Write project information (rows are zero-based in XlsxWriter)
+        row = 0
+        ws.merge_range(row, 0, row, 7, f'BILL OF QUANTITIES - {self.project_name}', title_fmt)
+
+        row += 1
+        ws.write_string(row, 0, 'Project Number:')
+        ws.write(row, 1, self.project_number)
+
+        row += 1
+        ws.write_string(row, 0, 'Date:')
+        ws.write_string(row, 1, self.metadata['created_date'])
+
+        row += 1
+        ws.write_string(row, 0, 'Generated by:')
+        ws.write_string(row, 1, self.metadata['software'])
+
+        row += 2  # Blank line
+
+        ws.write_row(row, 0, headers, header_fmt)
 
         row += 1
         data_start_row = row
+        last_col = len(headers) - 1
 
-        # Write data rows
-        current_section = ""
+        # Group items by section once, keeping sections in the order they first
+        # appear, so every section gets exactly one header row
+        sections: Dict[str, List[BOQItem]] = {}
         for item in self.items:
-            # Add section header if section changes
-            if item.section and item.section != current_section:
-                ws.merge_cells(f'A{row}:{openpyxl.utils.get_column_letter(len(headers))}{row}')
-                cell = ws[f'A{row}']
-                cell.value = item.section
-                cell.font = section_font
-                cell.fill = section_fill
-                cell.alignment = Alignment(horizontal='left', vertical='center')
+            sections.setdefault(item.section, []).append(item)
+
+        # Write data rows; the writer methods are looked up once, not per cell.
+        # Text columns go through write(), which picks the cell type from the
+        # value, so non-string values (an int item number, a None subsection)
+        # are written as the old openpyxl export wrote them
+        write = ws.write
+        write_number = ws.write_number
+        for section, section_items in sections.items():
+            if section:
+                ws.merge_range(row, 0, row, last_col, section, section_fmt)
                 row += 1
-                current_section = item.section
-
-            # Write item data
-            data = [
-                item.item_number,
-                item.section,
-                item.subsection,
-                item.description,
-                item.unit,
-                item.quantity,
-                item.rate,
-                item.amount
-            ]
 
-            if include_calculations:
-                data.extend([
-                    item.calculation_notes,
-                    item.reference_drawing,
-                    item.measurement_rule
-                ])
-
-            for col, value in enumerate(data, start=1):
-                cell = ws.cell(row=row, column=col)
-                cell.value = value
-                cell.border = border
-
-                # Format numbers
-                if col in [6, 7, 8]:  # Quantity, Rate, Amount columns
-                    if isinstance(value, (int, float)):
-                        cell.number_format = '#,##0.00'
-                        cell.alignment = Alignment(horizontal='right')
+            for item in section_items:
+                write(row, 0, item.item_number, text_fmt)
+                write(row, 1, item.section, text_fmt)
+                write(row, 2, item.subsection, text_fmt)
+                write(row, 3, item.description, text_fmt)
+                write(row, 4, item.unit, text_fmt)
+                write_number(row, 5, item.quantity, num_fmt)
+                write_number(row, 6, item.rate, num_fmt)
+                write_number(row, 7, item.amount, num_fmt)
+
+                if include_calculations:
+                    write(row, 8, item.calculation_notes, text_fmt)
+                    write(row, 9, item.reference_drawing, text_fmt)
+                    write(row, 10, item.measurement_rule, text_fmt)
 
-            row += 1
+                row += 1
 
         # Write summary section
         row += 1
-        total_amount = sum(item.amount for item in self.items)
-
-        ws.merge_cells(f'A{row}:{openpyxl.utils.get_column_letter(len(headers)-1)}{row}')
-        cell = ws[f'A{row}']
-        cell.value = 'TOTAL'
-        cell.font = section_font
-        cell.alignment = Alignment(horizontal='right')
 
-        cell = ws.cell(row=row, column=len(headers))
-        cell.value = total_amount
-        cell.font = section_font
-        cell.number_format = '#,##0.00'
-        cell.border = border
+        ws.merge_range(row, 0, row, last_col - 1, 'TOTAL', total_label_fmt)
+        ws.write_number(row, last_col, self._total_cents() / 100, total_fmt)
 
         # Freeze panes (freeze header row)
-        ws.freeze_panes = f'A{data_start_row}'
+        ws.freeze_panes(data_start_row, 0)
 
         # Save workbook
-        wb.save(output_file)
+        wb.close()
+        if self.durable:
+            with open(output_file, 'r+b') as f:
+                _sync_file(f)
         return str(output_file)
 
     def export_to_xml(self, output_path: str, include_calculations: bool = True) -> str:
@@ -325,47 +422,52 @@ class QSPlusExporter:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create root element
-        root = ET.Element('BillOfQuantities')
-
-        # Add project information
-        project_info = ET.SubElement(root, 'ProjectInformation')
-        ET.SubElement(project_info, 'ProjectName').text = self.project_name
-        ET.SubElement(project_info, 'ProjectNumber').text = self.project_number
-        ET.SubElement(project_info, 'CreatedDate').text = self.metadata['created_date']
-        ET.SubElement(project_info, 'Software').text = self.metadata['software']
-        ET.SubElement(project_info, 'Version').text = self.metadata['version']
-
-        # Add items
-        items_element = ET.SubElement(root, 'Items')
-
-        for item in self.items:
-            item_element = ET.SubElement(items_element, 'Item')
-            ET.SubElement(item_element, 'ItemNumber').text = item.item_number
-            ET.SubElement(item_element, 'Section').text = item.section
-            ET.SubElement(item_element, 'Subsection').text = item.subsection
-            ET.SubElement(item_element, 'Description').text = item.description
-            ET.SubElement(item_element, 'Unit').text = item.unit
-            ET.SubElement(item_element, 'Quantity').text = str(item.quantity)
-            ET.SubElement(item_element, 'Rate').text = str(item.rate)
-            ET.SubElement(item_element, 'Amount').text = str(item.amount)
-
-            if include_calculations:
-                ET.SubElement(item_element, 'CalculationNotes').text = item.calculation_notes
-                ET.SubElement(item_element, 'ReferenceDrawing').text = item.reference_drawing
-                ET.SubElement(item_element, 'MeasurementRule').text = item.measurement_rule
-
-        # Add summary
-        summary = ET.SubElement(root, 'Summary')
-        total_amount = sum(item.amount for item in self.items)
-        ET.SubElement(summary, 'TotalItems').text = str(len(self.items))
-        ET.SubElement(summary, 'TotalAmount').text = f'{total_amount:.2f}'
-
-        # Pretty print XML
-        xml_str = minidom.parseString(ET.tostring(root)).toprettyxml(indent="  ")
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(xml_str)
+        count = len(_XML_TAGS) if include_calculations else _BASIC_COLUMNS
+        getter = _BOQ_GETTER if include_calculations else _BOQ_BASIC_GETTER
+        fields = _XML_ITEM_FIELDS[:count]
+        converters = _XML_CONVERTERS[:count]
+
+        def element(tag: str, text: str, depth: int) -> str:
+            indent = '\n' + '  ' * depth
+            text = _escape_xml(text)
+            return f'{indent}<{tag}>{text}</{tag}>' if text else f'{indent}<{tag}/>'
+
+        # The schema is fixed, so the document is written directly from tag
+        # fragments rather than through a tree or SAX generator
+        with open(output_file, 'wb', buffering=_WRITE_BUFFER) as f:
+            f.write(''.join((
+                '<?xml version="1.0" encoding="utf-8"?>\n<BillOfQuantities>',
+                '\n  <ProjectInformation>',
+                element('ProjectName', self.project_name, 2),
+                element('ProjectNumber', self.project_number, 2),
+                element('CreatedDate', self.metadata['created_date'], 2),
+                element('Software', self.metadata['software'], 2),
+                element('Version', self.metadata['version'], 2),
+                '\n  </ProjectInformation>',
+                '\n  <Items>',
+            )).encode('utf-8'))
+
+            for values in map(getter, self.items):
+                parts = ['\n    <Item>']
+                parts.extend([
+                    f'{open_tag}{text}{close_tag}' if text else empty_tag
+                    for (open_tag, close_tag, empty_tag), convert, value
+                    in zip(fields, converters, values)
+                    for text in (convert(value),)
+                ])
+                parts.append('\n    </Item>')
+                f.write(''.join(parts).encode('utf-8'))
+
+            f.write(''.join((
+                '\n  </Items>',
+                '\n  <Summary>',
+                element('TotalItems', str(len(self.items)), 2),
+                element('TotalAmount', _format_cents(self._total_cents()), 2),
+                '\n  </Summary>',
+                '\n</BillOfQuantities>\n',
+            )).encode('utf-8'))
+            if self.durable:
+                _sync_file(f)
 
         return str(output_file)
 
@@ -383,6 +485,9 @@ class QSPlusExporter:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Pick the item converter once instead of removing keys from every item
+        to_dict = BOQItem.to_dict if include_calculations else BOQItem._to_basic_dict
+
         # Build JSON structure
         data = {
             'project_information': {
@@ -392,30 +497,95 @@ class QSPlusExporter:
                 'software': self.metadata['software'],
                 'version': self.metadata['version']
             },
-            'items': []
+            'items': [to_dict(item) for item in self.items]
         }
 
-        for item in self.items:
-            item_data = item.to_dict()
-            if not include_calculations:
-                # Remove calculation-related fields
-                item_data.pop('Calculation Notes', None)
-                item_data.pop('Reference Drawing', None)
-                item_data.pop('Measurement Rule', None)
-            data['items'].append(item_data)
-
         # Add summary
-        total_amount = sum(item.amount for item in self.items)
         data['summary'] = {
             'total_items': len(self.items),
-            'total_amount': round(total_amount, 2)
+            'total_amount': self._total_cents() / 100
         }
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # orjson encodes straight to UTF-8 bytes; fall back to the stdlib encoder.
+        # Imported here so only JSON exports pay for loading it.
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+        with open(output_file, 'wb', buffering=_WRITE_BUFFER) as f:
+            f.write(payload)
+            if self.durable:
+                _sync_file(f)
 
         return str(output_file)
 
+    def export_all(
+        self,
+        output_base: str,
+        formats: tuple = ('excel', 'csv', 'xml', 'json'),
+        include_calculations: bool = True
+    ) -> List[str]:
+        """
+        Export BOQ to several formats in parallel, one worker process per format
+
+        Args:
+            output_base: Output path without extension; each format adds its own
+            formats: Formats to export ('excel' or 'xlsx', 'csv', 'xml', 'json')
+            include_calculations: Whether to include calculation notes and references
+
+        Returns:
+            Paths to the created files, one per distinct format, in the order
+            the formats were first given
+        """
+        # 'xlsx' is accepted as an alias for 'excel', as in export_boq_to_qsplus.
+        # Repeats are dropped (keeping order) so no two workers write one file
+        formats = list(dict.fromkeys(
+            'excel' if fmt.lower() == 'xlsx' else fmt.lower() for fmt in formats
+        ))
+        for fmt in formats:
+            if fmt not in _EXPORT_FORMATS:
+                raise ValueError(f"Unsupported format: {fmt}. Use 'excel', 'csv', 'xml', or 'json'")
+        if not formats:
+            return []
+
+        # Imported here so callers that never export in parallel don't load
+        # multiprocessing at module import
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=len(formats)) as pool:
+            futures = [
+                pool.submit(
+                    _export_one, self.items, self.project_name, self.project_number,
+                    self.metadata, fmt, f'{output_base}.{_EXPORT_FORMATS[fmt][1]}',
+                    include_calculations, self.durable
+                )
+                for fmt in formats
+            ]
+            return [future.result() for future in futures]
+
+
+def _export_one(
+    items: List[BOQItem],
+    project_name: str,
+    project_number: str,
+    metadata: Dict,
+    fmt: str,
+    output_path: str,
+    include_calculations: bool,
+    durable: bool
+) -> str:
+    """Run a single format export in a worker process for export_all"""
+    exporter = QSPlusExporter(project_name, project_number, durable)
+    exporter.metadata = metadata
+    exporter.add_items(items)
+    return getattr(exporter, _EXPORT_FORMATS[fmt][0])(output_path, include_calculations)
+
 
 # Convenience functions for quick exports
 def export_boq_to_qsplus(
@@ -502,18 +672,6 @@ if __name__ == "__main__":
     )
     exporter.add_items(sample_items)
 
-    # Export to Excel
-    excel_file = exporter.export_to_excel("sample_boq.xlsx")
-    print(f"Excel export created: {excel_file}")
-
-    # Export to CSV
-    csv_file = exporter.export_to_csv("sample_boq.csv")
-    print(f"CSV export created: {csv_file}")
-
-    # Export to XML
-    xml_file = exporter.export_to_xml("sample_boq.xml")
-    print(f"XML export created: {xml_file}")
-
-    # Export to JSON
-    json_file = exporter.export_to_json("sample_boq.json")
-    print(f"JSON export created: {json_file}")
+    # Export to all formats in parallel
+    for output_file in exporter.export_all("sample_boq"):
+        print(f"Export created: {output_file}")
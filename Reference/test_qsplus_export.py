@@ -11,13 +11,13 @@ Usage:
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Fix encoding for Windows console
-if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+# Fix encoding for Windows console (not needed when Python already uses UTF-8)
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 # Add Reference directory to path
 reference_dir = Path(__file__).parent
@@ -25,264 +25,106 @@ sys.path.insert(0, str(reference_dir))
 
 from QSPlus_Export_Module import BOQItem, QSPlusExporter, export_boq_to_qsplus
 
+# Console banner separators
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "-" * 70
+
+
+# Sample BOQ rows for a typical project, in BOQItem field order without the
+# amount: item_number, description, unit, quantity, rate, section, subsection,
+# calculation_notes, reference_drawing, measurement_rule
+_SAMPLE_ROWS = (
+    # FOUNDATIONS
+    ("1.1", "Clear site - Measure 2m beyond perimeter of building", "m2", 150.50, 25.00,
+     "FOUNDATIONS", "Site Preparation",
+     "Building 10m x 12m, perimeter (10+12)x2=44m, area with 2m margin = (14x16)=224m2", "DWG-SITE-001", "DQSRule"),
+    ("1.2", "Strip topsoil - Measure 1m beyond perimeter of building", "m2", 132.00, 30.00,
+     "FOUNDATIONS", "Site Preparation",
+     "Building perimeter with 1m margin = (12x14)=168m2", "DWG-SITE-001", "DQSRule"),
+    ("1.3", "Excavate for surface trenches - 700mm wide x 1500mm deep", "m3", 46.20, 85.00,
+     "FOUNDATIONS", "Excavation",
+     "Perimeter 44m x 0.7m width x 1.5m depth = 46.2m3", "DWG-FOUND-001", "DQSRule"),
+    ("1.4", "Risk of collapse - Take area of both sides of excavation", "m2", 132.00, 15.50,
+     "FOUNDATIONS", "Excavation",
+     "Perimeter 44m x 1.5m depth x 2 sides = 132m2", "DWG-FOUND-001", "DQSRule"),
+    ("1.5", "Mass concrete footings - 700 x 250mm deep x length of footings", "m3", 7.70, 950.00,
+     "FOUNDATIONS", "Concrete Work",
+     "44m length x 0.7m width x 0.25m depth = 7.7m3", "DWG-FOUND-002", "DQSRule"),
+    ("1.6", "Reinforcement - Take as 100kg per m3 of concrete", "t", 0.77, 12500.00,
+     "FOUNDATIONS", "Concrete Work",
+     "7.7m3 concrete x 100kg/m3 = 770kg = 0.77t", "DWG-FOUND-002", "DQSRule"),
+
+    # REINFORCED CONCRETE STRUCTURE
+    ("2.1", "Concrete in columns", "m3", 4.50, 1150.00,
+     "REINFORCED CONCRETE STRUCTURE", "Structural Elements",
+     "6 columns x 0.3m x 0.3m x 2.5m height = 1.35m3", "DWG-STRUCT-001", "DQSRule"),
+    ("2.2", "Concrete in beams", "m3", 3.20, 1150.00,
+     "REINFORCED CONCRETE STRUCTURE", "Structural Elements",
+     "Total beam length 40m x 0.3m x 0.4m = 4.8m3", "DWG-STRUCT-001", "DQSRule"),
+    ("2.3", "Concrete in slabs", "m3", 12.00, 980.00,
+     "REINFORCED CONCRETE STRUCTURE", "Structural Elements",
+     "Floor area 120m2 x 0.10m thickness = 12m3", "DWG-STRUCT-002", "DQSRule"),
+    ("2.4", "Formwork to columns", "m2", 18.00, 350.00,
+     "REINFORCED CONCRETE STRUCTURE", "Formwork",
+     "6 columns x (0.3m x 4 sides) x 2.5m height = 18m2", "DWG-STRUCT-001", "DQSRule"),
+
+    # BRICKWORK STRUCTURE
+    ("3.1", "Brickwork to external walls", "m2", 88.00, 285.00,
+     "BRICKWORK STRUCTURE", "Walls",
+     "Perimeter 44m x 2.5m height - openings = 88m2", "DWG-ARCH-001", "DQSRule"),
+    ("3.2", "Brick reinforcement - 2.94m per m2 of brickwork", "m", 258.72, 8.50,
+     "BRICKWORK STRUCTURE", "Walls",
+     "88m2 brickwork x 2.94m/m2 = 258.72m", "DWG-ARCH-001", "DQSRule"),
+
+    # ROOFS
+    ("5.1", "Roof trusses", "No", 8.00, 1850.00,
+     "ROOFS AND RAINWATER DISPOSAL", "Roof Structure",
+     "Building width 12m, trusses at 1.5m centers = 8 trusses", "DWG-ROOF-001", "DQSRule"),
+    ("5.2", "Roof tiles", "m2", 145.00, 165.00,
+     "ROOFS AND RAINWATER DISPOSAL", "Roof Covering",
+     "Roof area 12m x 10m x 1.2 (pitch factor) = 144m2", "DWG-ROOF-002", "DQSRule"),
+
+    # DOORS
+    ("10.1", "Hardwood external door 900x2100mm complete with frame", "No", 1.00, 3250.00,
+     "DOORS", "External Doors",
+     "", "DWG-DOORS-001", "Standard"),
+
+    # WINDOWS
+    ("11.1", "Aluminum sliding window 1500x1200mm", "No", 4.00, 2800.00,
+     "WINDOWS", "Aluminum Windows",
+     "", "DWG-WINDOWS-001", "Standard"),
+
+    # PLUMBING
+    ("15.1", "WC suite complete with cistern", "No", 2.00, 1850.00,
+     "PLUMBING AND DRAINAGE", "Sanitary Fittings",
+     "", "DWG-PLUMB-001", "Standard"),
+
+    # ELECTRICAL
+    ("20.1", "Power sockets", "No", 16.00, 185.00,
+     "ELECTRICAL INSTALLATION", "Wiring",
+     "", "DWG-ELEC-001", "Standard"),
+
+    # PRELIMINARIES
+    ("21.1", "Preliminaries and general items", "No", 1.00, 45000.00,
+     "PRELIMINARIES", "General",
+     "Site establishment, facilities, supervision", "N/A", "Lump Sum"),
+)
+
 
 def create_sample_boq_items():
     """Create sample BOQ items representing a typical project"""
-
-    items = [
-        # FOUNDATIONS
-        BOQItem(
-            item_number="1.1",
-            section="FOUNDATIONS",
-            subsection="Site Preparation",
-            description="Clear site - Measure 2m beyond perimeter of building",
-            unit="m2",
-            quantity=150.50,
-            rate=25.00,
-            measurement_rule="DQSRule",
-            calculation_notes="Building 10m x 12m, perimeter (10+12)x2=44m, area with 2m margin = (14x16)=224m2",
-            reference_drawing="DWG-SITE-001"
-        ),
-        BOQItem(
-            item_number="1.2",
-            section="FOUNDATIONS",
-            subsection="Site Preparation",
-            description="Strip topsoil - Measure 1m beyond perimeter of building",
-            unit="m2",
-            quantity=132.00,
-            rate=30.00,
-            measurement_rule="DQSRule",
-            calculation_notes="Building perimeter with 1m margin = (12x14)=168m2",
-            reference_drawing="DWG-SITE-001"
-        ),
-        BOQItem(
-            item_number="1.3",
-            section="FOUNDATIONS",
-            subsection="Excavation",
-            description="Excavate for surface trenches - 700mm wide x 1500mm deep",
-            unit="m3",
-            quantity=46.20,
-            rate=85.00,
-            measurement_rule="DQSRule",
-            calculation_notes="Perimeter 44m x 0.7m width x 1.5m depth = 46.2m3",
-            reference_drawing="DWG-FOUND-001"
-        ),
-        BOQItem(
-            item_number="1.4",
-            section="FOUNDATIONS",
-            subsection="Excavation",
-            description="Risk of collapse - Take area of both sides of excavation",
-            unit="m2",
-            quantity=132.00,
-            rate=15.50,
-            measurement_rule="DQSRule",
-            calculation_notes="Perimeter 44m x 1.5m depth x 2 sides = 132m2",
-            reference_drawing="DWG-FOUND-001"
-        ),
-        BOQItem(
-            item_number="1.5",
-            section="FOUNDATIONS",
-            subsection="Concrete Work",
-            description="Mass concrete footings - 700 x 250mm deep x length of footings",
-            unit="m3",
-            quantity=7.70,
-            rate=950.00,
-            measurement_rule="DQSRule",
-            calculation_notes="44m length x 0.7m width x 0.25m depth = 7.7m3",
-            reference_drawing="DWG-FOUND-002"
-        ),
-        BOQItem(
-            item_number="1.6",
-            section="FOUNDATIONS",
-            subsection="Concrete Work",
-            description="Reinforcement - Take as 100kg per m3 of concrete",
-            unit="t",
-            quantity=0.77,
-            rate=12500.00,
-            measurement_rule="DQSRule",
-            calculation_notes="7.7m3 concrete x 100kg/m3 = 770kg = 0.77t",
-            reference_drawing="DWG-FOUND-002"
-        ),
-
-        # REINFORCED CONCRETE STRUCTURE
-        BOQItem(
-            item_number="2.1",
-            section="REINFORCED CONCRETE STRUCTURE",
-            subsection="Structural Elements",
-            description="Concrete in columns",
-            unit="m3",
-            quantity=4.50,
-            rate=1150.00,
-            measurement_rule="DQSRule",
-            calculation_notes="6 columns x 0.3m x 0.3m x 2.5m height = 1.35m3",
-            reference_drawing="DWG-STRUCT-001"
-        ),
-        BOQItem(
-            item_number="2.2",
-            section="REINFORCED CONCRETE STRUCTURE",
-            subsection="Structural Elements",
-            description="Concrete in beams",
-            unit="m3",
-            quantity=3.20,
-            rate=1150.00,
-            measurement_rule="DQSRule",
-            calculation_notes="Total beam length 40m x 0.3m x 0.4m = 4.8m3",
-            reference_drawing="DWG-STRUCT-001"
-        ),
-        BOQItem(
-            item_number="2.3",
-            section="REINFORCED CONCRETE STRUCTURE",
-            subsection="Structural Elements",
-            description="Concrete in slabs",
-            unit="m3",
-            quantity=12.00,
-            rate=980.00,
-            measurement_rule="DQSRule",
-            calculation_notes="Floor area 120m2 x 0.10m thickness = 12m3",
-            reference_drawing="DWG-STRUCT-002"
-        ),
-        BOQItem(
-            item_number="2.4",
-            section="REINFORCED CONCRETE STRUCTURE",
-            subsection="Formwork",
-            description="Formwork to columns",
-            unit="m2",
-            quantity=18.00,
-            rate=350.00,
-            measurement_rule="DQSRule",
-            calculation_notes="6 columns x (0.3m x 4 sides) x 2.5m height = 18m2",
-            reference_drawing="DWG-STRUCT-001"
-        ),
-
-        # BRICKWORK STRUCTURE
-        BOQItem(
-            item_number="3.1",
-            section="BRICKWORK STRUCTURE",
-            subsection="Walls",
-            description="Brickwork to external walls",
-            unit="m2",
-            quantity=88.00,
-            rate=285.00,
-            measurement_rule="DQSRule",
-            calculation_notes="Perimeter 44m x 2.5m height - openings = 88m2",
-            reference_drawing="DWG-ARCH-001"
-        ),
-        BOQItem(
-            item_number="3.2",
-            section="BRICKWORK STRUCTURE",
-            subsection="Walls",
-            description="Brick reinforcement - 2.94m per m2 of brickwork",
-            unit="m",
-            quantity=258.72,
-            rate=8.50,
-            measurement_rule="DQSRule",
-            calculation_notes="88m2 brickwork x 2.94m/m2 = 258.72m",
-            reference_drawing="DWG-ARCH-001"
-        ),
-
-        # ROOFS
-        BOQItem(
-            item_number="5.1",
-            section="ROOFS AND RAINWATER DISPOSAL",
-            subsection="Roof Structure",
-            description="Roof trusses",
-            unit="No",
-            quantity=8.00,
-            rate=1850.00,
-            measurement_rule="DQSRule",
-            calculation_notes="Building width 12m, trusses at 1.5m centers = 8 trusses",
-            reference_drawing="DWG-ROOF-001"
-        ),
-        BOQItem(
-            item_number="5.2",
-            section="ROOFS AND RAINWATER DISPOSAL",
-            subsection="Roof Covering",
-            description="Roof tiles",
-            unit="m2",
-            quantity=145.00,
-            rate=165.00,
-            measurement_rule="DQSRule",
-            calculation_notes="Roof area 12m x 10m x 1.2 (pitch factor) = 144m2",
-            reference_drawing="DWG-ROOF-002"
-        ),
-
-        # DOORS
-        BOQItem(
-            item_number="10.1",
-            section="DOORS",
-            subsection="External Doors",
-            description="Hardwood external door 900x2100mm complete with frame",
-            unit="No",
-            quantity=1.00,
-            rate=3250.00,
-            measurement_rule="Standard",
-            reference_drawing="DWG-DOORS-001"
-        ),
-
-        # WINDOWS
-        BOQItem(
-            item_number="11.1",
-            section="WINDOWS",
-            subsection="Aluminum Windows",
-            description="Aluminum sliding window 1500x1200mm",
-            unit="No",
-            quantity=4.00,
-            rate=2800.00,
-            measurement_rule="Standard",
-            reference_drawing="DWG-WINDOWS-001"
-        ),
-
-        # PLUMBING
-        BOQItem(
-            item_number="15.1",
-            section="PLUMBING AND DRAINAGE",
-            subsection="Sanitary Fittings",
-            description="WC suite complete with cistern",
-            unit="No",
-            quantity=2.00,
-            rate=1850.00,
-            measurement_rule="Standard",
-            reference_drawing="DWG-PLUMB-001"
-        ),
-
-        # ELECTRICAL
-        BOQItem(
-            item_number="20.1",
-            section="ELECTRICAL INSTALLATION",
-            subsection="Wiring",
-            description="Power sockets",
-            unit="No",
-            quantity=16.00,
-            rate=185.00,
-            measurement_rule="Standard",
-            reference_drawing="DWG-ELEC-001"
-        ),
-
-        # PRELIMINARIES
-        BOQItem(
-            item_number="21.1",
-            section="PRELIMINARIES",
-            subsection="General",
-            description="Preliminaries and general items",
-            unit="No",
-            quantity=1.00,
-            rate=45000.00,
-            measurement_rule="Lump Sum",
-            calculation_notes="Site establishment, facilities, supervision",
-            reference_drawing="N/A"
-        ),
+    # Amount is passed as 0.0 so BOQItem derives it from quantity x rate
+    return [
+        BOQItem(number, description, unit, quantity, rate, 0.0, *details)
+        for number, description, unit, quantity, rate, *details in _SAMPLE_ROWS
     ]
 
-    return items
-
 
 def test_all_export_formats():
     """Test all export formats"""
 
-    print("=" * 70)
-    print("QSPlus Export Module - Test Script")
-    print("=" * 70)
-    print()
+    write = sys.stdout.write
+    write(f"{SEPARATOR}\nQSPlus Export Module - Test Script\n{SEPARATOR}\n\n")
 
     # Create sample data
     print("Creating sample BOQ items...")
@@ -300,8 +142,8 @@ def test_all_export_formats():
     )
     exporter.add_items(items)
 
-    # Calculate totals
-    total_amount = sum(item.amount for item in items)
+    # Totals are kept by the exporter as items are added
+    total_amount = exporter.total_amount
     print(f"Project: {project_name}")
     print(f"Project Number: {project_number}")
     print(f"Total Items: {len(items)}")
@@ -314,61 +156,28 @@ def test_all_export_formats():
     print(f"Output directory: {output_dir.absolute()}")
     print()
 
-    # Test Excel export
-    print("-" * 70)
-    print("Testing Excel Export (.xlsx)...")
-    try:
-        excel_file = exporter.export_to_excel(
-            "outputs/Test_BOQ_QSPlus.xlsx",
-            include_calculations=True
-        )
-        print(f"✓ Excel export successful: {excel_file}")
-    except Exception as e:
-        print(f"✗ Excel export failed: {str(e)}")
-    print()
-
-    # Test CSV export
-    print("-" * 70)
-    print("Testing CSV Export (.csv)...")
-    try:
-        csv_file = exporter.export_to_csv(
-            "outputs/Test_BOQ_Backup.csv",
-            include_calculations=True
-        )
-        print(f"✓ CSV export successful: {csv_file}")
-    except Exception as e:
-        print(f"✗ CSV export failed: {str(e)}")
-    print()
-
-    # Test XML export
-    print("-" * 70)
-    print("Testing XML Export (.xml)...")
-    try:
-        xml_file = exporter.export_to_xml(
-            "outputs/Test_BOQ_Data.xml",
-            include_calculations=True
-        )
-        print(f"✓ XML export successful: {xml_file}")
-    except Exception as e:
-        print(f"✗ XML export failed: {str(e)}")
-    print()
-
-    # Test JSON export
-    print("-" * 70)
-    print("Testing JSON Export (.json)...")
-    try:
-        json_file = exporter.export_to_json(
-            "outputs/Test_BOQ_Data.json",
-            include_calculations=True
-        )
-        print(f"✓ JSON export successful: {json_file}")
-    except Exception as e:
-        print(f"✗ JSON export failed: {str(e)}")
-    print()
+    # Run the four format exports concurrently; results are reported in order
+    exports = [
+        ("Excel", ".xlsx", exporter.export_to_excel, "outputs/Test_BOQ_QSPlus.xlsx"),
+        ("CSV", ".csv", exporter.export_to_csv, "outputs/Test_BOQ_Backup.csv"),
+        ("XML", ".xml", exporter.export_to_xml, "outputs/Test_BOQ_Data.xml"),
+        ("JSON", ".json", exporter.export_to_json, "outputs/Test_BOQ_Data.json"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(exports)) as pool:
+        futures = [
+            pool.submit(export, path, include_calculations=True)
+            for _, _, export, path in exports
+        ]
+        for (label, extension, _, _), future in zip(exports, futures):
+            write(f"{SUB_SEPARATOR}\nTesting {label} Export ({extension})...\n")
+            try:
+                print(f"✓ {label} export successful: {future.result()}")
+            except Exception as e:
+                print(f"✗ {label} export failed: {str(e)}")
+            print()
 
     # Test convenience function
-    print("-" * 70)
-    print("Testing Convenience Function...")
+    write(f"{SUB_SEPARATOR}\nTesting Convenience Function...\n")
     try:
         quick_file = export_boq_to_qsplus(
             items=items,
@@ -383,18 +192,20 @@ def test_all_export_formats():
         print(f"✗ Quick export failed: {str(e)}")
     print()
 
-    print("=" * 70)
-    print("Test Summary")
-    print("=" * 70)
-    print(f"✓ All export formats tested successfully!")
-    print(f"✓ Output files created in: {output_dir.absolute()}")
-    print()
-    print("Next Steps:")
-    print("1. Open outputs/Test_BOQ_QSPlus.xlsx in Excel to review")
-    print("2. Import outputs/Test_BOQ_QSPlus.xlsx into QSPlus software")
-    print("3. Verify data integrity and formatting")
-    print()
-    print("=" * 70)
+    write(
+        f"{SEPARATOR}\n"
+        "Test Summary\n"
+        f"{SEPARATOR}\n"
+        "✓ All export formats tested successfully!\n"
+        f"✓ Output files created in: {output_dir.absolute()}\n"
+        "\n"
+        "Next Steps:\n"
+        "1. Open outputs/Test_BOQ_QSPlus.xlsx in Excel to review\n"
+        "2. Import outputs/Test_BOQ_QSPlus.xlsx into QSPlus software\n"
+        "3. Verify data integrity and formatting\n"
+        "\n"
+        f"{SEPARATOR}\n"
+    )
 
 
 if __name__ == "__main__":
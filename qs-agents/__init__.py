@@ -18,13 +18,18 @@ Usage:
 __version__ = "1.0.0"
 __author__ = "Dell QS"
 
-from .agents import IntakeAnalyst, IntakeResult
-from .tools import (
-    PDFParser,
-    DrawingClassifier,
-    MetadataExtractor,
-    Geocoder,
-)
+import importlib
+
+# Public names and the subpackage that provides each one. They are imported
+# on first access (PEP 562) so importing the package stays cheap.
+_LAZY_IMPORTS = {
+    "IntakeAnalyst": ".agents",
+    "IntakeResult": ".agents",
+    "PDFParser": ".tools",
+    "DrawingClassifier": ".tools",
+    "MetadataExtractor": ".tools",
+    "Geocoder": ".tools",
+}
 
 __all__ = [
     # Agents
@@ -36,3 +41,18 @@ __all__ = [
     "MetadataExtractor",
     "Geocoder",
 ]
+
+
+def __getattr__(name: str):
+    """Import a public name from its subpackage on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
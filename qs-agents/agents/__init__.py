@@ -4,9 +4,31 @@ This package contains the Python implementations of QS agents that
 orchestrate the tools to perform their assigned tasks.
 """
 
-from .intake_analyst import IntakeAnalyst, IntakeResult
+import importlib
+
+# Public names and the module that provides each one, imported on first
+# access (PEP 562) so the agent and its tools load only when used.
+_LAZY_IMPORTS = {
+    "IntakeAnalyst": ".intake_analyst",
+    "IntakeResult": ".intake_analyst",
+}
 
 __all__ = [
     "IntakeAnalyst",
     "IntakeResult",
 ]
+
+
+def __getattr__(name: str):
+    """Import a public name from its module on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -15,13 +15,16 @@ Outputs:
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import uuid
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Sequence, Union
 
 from ..tools import (
     PDFParser,
@@ -30,6 +33,7 @@ from ..tools import (
     ClassificationResult,
     MetadataExtractor,
     ExtractionResult,
+    PageText,
     Geocoder,
     GeocodingResult,
 )
@@ -46,11 +50,46 @@ from ..tools.common import (
     MeasurementScope,
     MissingItem,
     MeasurableElement,
+    dump_json,
 )
 
 logger = logging.getLogger(__name__)
 
 
+# Why each missing drawing type matters for measurement
+MISSING_DRAWING_IMPACTS: dict[DrawingType, str] = {
+    DrawingType.FLOOR_PLAN: "Cannot measure floor areas, partitions, doors, or internal elements",
+    DrawingType.SITE_PLAN: "Cannot measure external works, site area, or verify building position",
+    DrawingType.ELEVATION: "Cannot measure external wall areas, windows, or cladding",
+    DrawingType.SECTION: "Cannot verify floor-to-floor heights or construction build-ups",
+    DrawingType.ROOF_PLAN: "Cannot measure roof area or rainwater goods",
+    DrawingType.DEMOLITION: "Cannot identify extent of demolition works for refurbishment",
+    DrawingType.SCHEDULE: "Must count elements manually from drawings",
+    DrawingType.STRUCTURAL: "Cannot verify foundation type or structural frame",
+}
+
+# Drawing types that must carry dimensions to be measurable
+KEY_MEASUREMENT_TYPES: frozenset[DrawingType] = frozenset({
+    DrawingType.FLOOR_PLAN,
+    DrawingType.ELEVATION,
+    DrawingType.SECTION,
+})
+
+# Measurement element to NRM1/NRM2 reference
+# Simplified mapping - would be more comprehensive in production
+NRM_REFERENCES: dict[str, str] = {
+    "Gross Internal Floor Area (GIFA)": "NRM1 2.6",
+    "Net Internal Area (NIA)": "NRM1 2.7",
+    "External wall areas": "NRM1 2.5.1",
+    "Roof area": "NRM1 2.5.2",
+    "Site area": "NRM1 2.1",
+    "Window areas and counts": "NRM2 L10/L20",
+    "Door areas and counts": "NRM2 L20",
+    "Ceiling areas": "NRM2 K10/K40",
+    "Floor construction depths": "NRM1 2.4.3",
+}
+
+
 @dataclass
 class IntakeResult:
     """Complete result of intake analysis."""
@@ -73,6 +112,18 @@ class IntakeResult:
             "warnings": self.warnings,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "IntakeResult":
+        return cls(
+            project_id=data["project_id"],
+            manifest=DocumentManifest.from_dict(data["manifest"]),
+            completeness=CompletenessReport.from_dict(data["completeness"]),
+            measurement_scope=MeasurementScope.from_dict(data["measurement_scope"]),
+            processing_time_ms=data["processing_time_ms"],
+            errors=data.get("errors", []),
+            warnings=data.get("warnings", []),
+        )
+
 
 class IntakeAnalyst:
     """
@@ -90,26 +141,26 @@ class IntakeAnalyst:
 
     # Required drawing types for different project types
     REQUIRED_DRAWINGS = {
-        "new_build_residential": [
+        "new_build_residential": frozenset({
             DrawingType.SITE_PLAN,
             DrawingType.FLOOR_PLAN,
             DrawingType.ELEVATION,
             DrawingType.SECTION,
-        ],
-        "new_build_commercial": [
+        }),
+        "new_build_commercial": frozenset({
             DrawingType.SITE_PLAN,
             DrawingType.FLOOR_PLAN,
             DrawingType.ELEVATION,
             DrawingType.SECTION,
             DrawingType.ROOF_PLAN,
-        ],
-        "refurbishment": [
+        }),
+        "refurbishment": frozenset({
             DrawingType.FLOOR_PLAN,
             DrawingType.DEMOLITION,
-        ],
-        "default": [
+        }),
+        "default": frozenset({
             DrawingType.FLOOR_PLAN,
-        ],
+        }),
     }
 
     # What can be measured from each drawing type
@@ -176,6 +227,13 @@ class IntakeAnalyst:
         ],
     }
 
+    # Reverse index of MEASUREMENT_POTENTIAL: the drawing type each element needs
+    ELEMENT_DRAWING_TYPE = {
+        element: drawing_type
+        for drawing_type, elements in MEASUREMENT_POTENTIAL.items()
+        for element in elements
+    }
+
     def __init__(self, config: Optional[dict[str, Any]] = None):
         """
         Initialize the Intake Analyst.
@@ -189,6 +247,17 @@ class IntakeAnalyst:
                 - openai_api_key: API key for OpenAI
                 - google_api_key: API key for Google Geocoding
                 - project_type: Expected project type for completeness check
+                - classify_concurrency: Max documents classified at once (default 8)
+                - vision_concurrency: Max page images classified at once (default 8)
+                - vision_batch_mode: Send large documents through the provider batch
+                  API (anthropic/openai only, default False)
+                - enable_class_cache: Cache classifications in output_dir (default True)
+                - enable_geo_cache: Cache geocoding lookups in output_dir (default True)
+                - image_dpi: Page render resolution (default 150)
+                - image_max_edge: Longest page image edge in pixels (default 2048)
+                - image_format: Page image format (default "webp")
+                - reuse_intake: Return the previous result for a project_id whose
+                  input PDFs are unchanged (default True)
 
         Note:
             By default, uses Claude Code CLI for vision classification. This leverages
@@ -204,14 +273,24 @@ class IntakeAnalyst:
         self.pdf_parser = PDFParser({
             "output_dir": str(self.output_dir / "images"),
             "extract_images": True,
-            "image_dpi": 150,
+            "image_dpi": self.config.get("image_dpi", 150),
+            # The vision models downsample large images anyway, so cap the
+            # rendered size and use lossy WebP to keep files small
+            "image_max_edge": self.config.get("image_max_edge", 2048),
+            "image_format": self.config.get("image_format", "webp"),
+            "image_quality": 85,
         })
 
         # Vision config - default to 'claude' (CLI) which uses authenticated session
         vision_config = {
             "provider": config.get("vision_provider", "claude") if config else "claude",
             "model": config.get("vision_model", "claude-sonnet-4-20250514") if config else "claude-sonnet-4-20250514",
+            "max_concurrency": self.config.get("vision_concurrency", 8),
+            "batch_mode": self.config.get("vision_batch_mode", False),
         }
+        # Persist confident classifications so re-runs skip the vision call
+        if self.config.get("enable_class_cache", True):
+            vision_config["cache_path"] = str(self.output_dir / "class_cache.sqlite")
         # Only set API key if explicitly provided (for direct API access)
         if config and config.get("anthropic_api_key"):
             vision_config["provider"] = "anthropic"
@@ -227,6 +306,9 @@ class IntakeAnalyst:
         if config and config.get("google_api_key"):
             geocoder_config["provider"] = "google"
             geocoder_config["google_api_key"] = config["google_api_key"]
+        # Postcodes repeat across a client's projects, so keep lookups on disk
+        if self.config.get("enable_geo_cache", True):
+            geocoder_config["cache_path"] = str(self.output_dir / "geo_cache.sqlite")
         self.geocoder = Geocoder(geocoder_config)
 
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -250,25 +332,47 @@ class IntakeAnalyst:
         start_time = time.time()
 
         input_path = Path(input_path)
+
+        # A previous run can only be found again under an explicit project ID
+        fingerprint = None
+        if project_id and self.config.get("reuse_intake", True):
+            fingerprint = self._input_fingerprint(input_path)
         project_id = project_id or str(uuid.uuid4())[:8].upper()
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        if fingerprint:
+            cached = self._load_snapshot(project_id, fingerprint)
+            if cached is not None:
+                self.logger.info(f"[{project_id}] Inputs unchanged, reusing previous intake analysis")
+                # Rewrite the reports so deleted or edited files are restored
+                await self._save_outputs(
+                    project_id,
+                    cached.manifest.to_dict(),
+                    cached.completeness,
+                    cached.measurement_scope,
+                )
+                cached.processing_time_ms = (time.time() - start_time) * 1000
+                return cached
+
         errors: list[dict[str, Any]] = []
         warnings: list[str] = []
 
         # Step 1: Parse PDFs
         self.logger.info(f"[{project_id}] Starting intake analysis for: {input_path}")
 
+        # Page images are named after their PDF, so keep each project's apart
+        images_dir = self.output_dir / project_id / "images"
+
         if input_path.is_file():
-            pdf_result = await self.pdf_parser.execute(input_path, self.output_dir / "images")
+            pdf_result = await self.pdf_parser.execute(input_path, images_dir)
             pdf_results = [pdf_result.data] if pdf_result.success and pdf_result.data else []
             if pdf_result.errors:
                 errors.extend([e.to_dict() for e in pdf_result.errors])
             warnings.extend(pdf_result.warnings)
         else:
-            batch_result = await self.pdf_parser.parse_directory(input_path, self.output_dir / "images")
+            batch_result = await self.pdf_parser.parse_directory(input_path, images_dir)
             pdf_results = batch_result.data if batch_result.success and batch_result.data else []
             if batch_result.errors:
                 errors.extend([e.to_dict() for e in batch_result.errors])
@@ -293,23 +397,21 @@ class IntakeAnalyst:
         # Step 2: Extract metadata from text
         self.logger.info(f"[{project_id}] Extracting metadata from {len(pdf_results)} documents")
 
-        all_pages = []
-        for pdf in pdf_results:
-            for page in pdf.pages:
-                all_pages.append({
-                    "text": page.text,
-                    "page_number": page.page_number,
-                    "source": pdf.file_name,
-                })
+        all_pages = [
+            PageText(page.text, page.page_number, pdf.file_name)
+            for pdf in pdf_results
+            for page in pdf.pages
+        ]
 
         metadata_result = await self.metadata_extractor.extract_from_pages(all_pages)
         project_metadata = metadata_result.data.metadata if metadata_result.success and metadata_result.data else ProjectMetadata()
         warnings.extend(metadata_result.warnings)
 
-        # Step 3: Enrich location with geocoding
-        if project_metadata.location and project_metadata.location.postcode:
-            self.logger.info(f"[{project_id}] Geocoding location: {project_metadata.location.postcode}")
-            geo_result = await self.geocoder.enrich_location(project_metadata.location)
+        # Step 3: Enrich location with geocoding, unless it already has coordinates
+        location = project_metadata.location
+        if location and location.postcode and location.needs_enrichment():
+            self.logger.info(f"[{project_id}] Geocoding location: {location.postcode}")
+            geo_result = await self.geocoder.enrich_location(location)
             if geo_result.success and geo_result.data:
                 project_metadata.location = geo_result.data
             warnings.extend(geo_result.warnings)
@@ -317,48 +419,19 @@ class IntakeAnalyst:
         # Step 4: Classify drawings using vision
         self.logger.info(f"[{project_id}] Classifying drawings")
 
+        # Classify each document concurrently; the semaphore bounds how many
+        # vision requests are in flight at once
+        semaphore = asyncio.Semaphore(self.config.get("classify_concurrency", 8))
+        classified = await asyncio.gather(*[
+            self._classify_document(pdf, semaphore) for pdf in pdf_results
+        ])
+
         all_drawings: list[DrawingInfo] = []
         document_entries: list[DocumentEntry] = []
-
-        for pdf in pdf_results:
-            doc_entry = pdf.to_document_entry()
-            doc_drawings: list[DrawingInfo] = []
-
-            # Get image paths for classification
-            image_paths = [
-                p.extracted_image_path
-                for p in pdf.pages
-                if p.extracted_image_path
-            ]
-
-            if image_paths:
-                classify_result = await self.classifier.classify_batch(
-                    image_paths,
-                    source_file=pdf.file_path,
-                )
-
-                if classify_result.success and classify_result.data:
-                    for i, classification in enumerate(classify_result.data):
-                        drawing_info = classification.to_drawing_info(
-                            file_path=pdf.file_path,
-                            page_number=i + 1,
-                        )
-                        # Add image path
-                        if i < len(image_paths):
-                            drawing_info.image_path = image_paths[i]
-                        # Add measurement potential based on type
-                        if drawing_info.drawing_type in self.MEASUREMENT_POTENTIAL:
-                            drawing_info.measurement_potential = self.MEASUREMENT_POTENTIAL[drawing_info.drawing_type]
-
-                        doc_drawings.append(drawing_info)
-                        all_drawings.append(drawing_info)
-
-                warnings.extend(classify_result.warnings)
-            else:
-                warnings.append(f"No images extracted from {pdf.file_name}")
-
-            doc_entry.drawings = doc_drawings
+        for doc_entry, doc_warnings in classified:
+            all_drawings.extend(doc_entry.drawings)
             document_entries.append(doc_entry)
+            warnings.extend(doc_warnings)
 
         # Step 5: Build manifest
         manifest = DocumentManifest(
@@ -370,28 +443,192 @@ class IntakeAnalyst:
             total_drawings=len(all_drawings),
         )
 
-        # Step 6: Assess completeness
-        completeness = self._assess_completeness(project_id, all_drawings, project_metadata)
-
-        # Step 7: Determine measurement scope
-        measurement_scope = self._determine_scope(project_id, all_drawings)
-
-        # Step 8: Save outputs
-        await self._save_outputs(project_id, manifest, completeness, measurement_scope)
-
-        processing_time = (time.time() - start_time) * 1000
-        self.logger.info(f"[{project_id}] Intake analysis complete in {processing_time:.0f}ms")
+        # Steps 6 and 7: Assess completeness and determine measurement scope.
+        # Both only read the drawings, so run them off the event loop together
+        completeness, measurement_scope = await asyncio.gather(
+            asyncio.to_thread(self._assess_completeness, project_id, all_drawings, project_metadata),
+            asyncio.to_thread(self._determine_scope, project_id, all_drawings),
+        )
 
-        return IntakeResult(
+        result = IntakeResult(
             project_id=project_id,
             manifest=manifest,
             completeness=completeness,
             measurement_scope=measurement_scope,
-            processing_time_ms=processing_time,
+            processing_time_ms=0.0,
             errors=errors,
             warnings=warnings,
         )
 
+        # Step 8: Save outputs. Serialize the result once so the manifest
+        # JSON and the intake snapshot share the same dicts
+        result_data = result.to_dict()
+        await self._save_outputs(project_id, result_data["manifest"], completeness, measurement_scope)
+
+        processing_time = (time.time() - start_time) * 1000
+        self.logger.info(f"[{project_id}] Intake analysis complete in {processing_time:.0f}ms")
+        result.processing_time_ms = result_data["processing_time_ms"] = processing_time
+
+        # Only a clean run is worth replaying
+        if fingerprint and not errors:
+            await asyncio.to_thread(self._save_snapshot, project_id, fingerprint, result_data)
+
+        return result
+
+    async def analyze_batch(
+        self,
+        input_paths: Sequence[str | Path],
+        max_concurrency: int = 4,
+    ) -> list[Union[IntakeResult, Exception]]:
+        """
+        Analyze several document packages concurrently, one project each.
+
+        Args:
+            input_paths: PDF files or directories, each analyzed as its own project
+            max_concurrency: Maximum number of packages analyzed at once
+
+        Returns:
+            One IntakeResult per input, in input order, or the exception that
+            package raised
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze_one(input_path: str | Path) -> IntakeResult:
+            async with semaphore:
+                return await self.analyze(input_path)
+
+        return await asyncio.gather(
+            *[analyze_one(p) for p in input_paths],
+            return_exceptions=True,
+        )
+
+    async def close(self) -> None:
+        """Release connections held by the underlying tools."""
+        await asyncio.gather(
+            self.pdf_parser.close(),
+            self.classifier.close(),
+            self.metadata_extractor.close(),
+            self.geocoder.close(),
+        )
+
+    async def __aenter__(self) -> "IntakeAnalyst":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _input_fingerprint(self, input_path: Path) -> Optional[str]:
+        """
+        Identify the input PDFs and the settings that shape an intake result.
+
+        Uses file paths, sizes and modification times rather than contents,
+        so checking an unchanged package costs one stat per PDF.
+        """
+        if input_path.is_file():
+            base, files = input_path.parent, [input_path]
+        elif input_path.is_dir():
+            base, files = input_path, sorted(input_path.glob("**/*.pdf"))
+        else:
+            return None
+
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(json.dumps([
+            str(input_path.resolve()),
+            self.project_type,
+            self.classifier.provider,
+            self.classifier.model,
+            # Classifier settings that change which pages are sent and how
+            # their results are shared
+            self.classifier.skip_blank_pages,
+            self.classifier.blank_ink_ratio,
+            self.classifier.dedupe_images,
+            self.classifier.dedupe_phash,
+            self.classifier.dedupe_hash_size,
+        ]).encode("utf-8"))
+        for file in files:
+            stat = file.stat()
+            digest.update(f"\0{file.relative_to(base)}\0{stat.st_size}\0{stat.st_mtime_ns}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _snapshot_path(self, project_id: str) -> Path:
+        """Location of the saved intake result for a project."""
+        return self.output_dir / project_id / "intake_result.json"
+
+    def _load_snapshot(self, project_id: str, fingerprint: str) -> Optional[IntakeResult]:
+        """Load the previous result for a project if its fingerprint matches."""
+        snapshot = self._snapshot_path(project_id)
+        try:
+            data = json.loads(snapshot.read_text(encoding="utf-8"))
+            if data.get("fingerprint") != fingerprint:
+                return None
+            return IntakeResult.from_dict(data["result"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable intake snapshot {snapshot}: {e}")
+            return None
+
+    def _save_snapshot(self, project_id: str, fingerprint: str, result_data: dict[str, Any]) -> None:
+        """Save an intake result (in to_dict() form) so an unchanged package can skip re-analysis."""
+        snapshot = self._snapshot_path(project_id)
+        try:
+            snapshot.write_text(json.dumps({
+                "fingerprint": fingerprint,
+                "result": result_data,
+            }, default=str), encoding="utf-8")
+        except OSError as e:
+            self.logger.warning(f"Could not save intake snapshot {snapshot}: {e}")
+
+    async def _classify_document(
+        self,
+        pdf: PDFParserResult,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[DocumentEntry, list[str]]:
+        """Classify the page images of one parsed PDF into a document entry."""
+        doc_entry = pdf.to_document_entry()
+        doc_drawings: list[DrawingInfo] = []
+        warnings: list[str] = []
+
+        # Get image paths for classification
+        image_paths = tuple(
+            p.extracted_image_path
+            for p in pdf.pages
+            if p.extracted_image_path
+        )
+
+        if image_paths:
+            async with semaphore:
+                classify_result = await self.classifier.classify_batch(
+                    image_paths,
+                    source_file=pdf.file_path,
+                )
+
+            if classify_result.success and classify_result.data:
+                # Results line up with image_paths, one per image
+                for i, (image_path, classification) in enumerate(zip(image_paths, classify_result.data)):
+                    drawing_info = classification.to_drawing_info(
+                        file_path=pdf.file_path,
+                        page_number=i + 1,
+                    )
+                    drawing_info.image_path = image_path
+                    # Add measurement potential based on type
+                    if drawing_info.drawing_type in self.MEASUREMENT_POTENTIAL:
+                        drawing_info.measurement_potential = self.MEASUREMENT_POTENTIAL[drawing_info.drawing_type]
+
+                    doc_drawings.append(drawing_info)
+
+            warnings.extend(classify_result.warnings)
+        else:
+            warnings.append(f"No images extracted from {pdf.file_name}")
+
+        doc_entry.drawings = doc_drawings
+        return doc_entry, warnings
+
     def _assess_completeness(
         self,
         project_id: str,
@@ -401,8 +638,18 @@ class IntakeAnalyst:
         """Assess document package completeness."""
         report = CompletenessReport(project_id=project_id)
 
-        # What drawing types do we have?
-        present_types = set(d.drawing_type for d in drawings if d.drawing_type != DrawingType.UNKNOWN)
+        # Single pass over the drawings: which types we have, plus the
+        # quality counts reported as warnings below
+        present_types: set[DrawingType] = set()
+        low_confidence = 0
+        no_dimensions = 0
+        for d in drawings:
+            if d.drawing_type != DrawingType.UNKNOWN:
+                present_types.add(d.drawing_type)
+            if d.confidence < 0.5:
+                low_confidence += 1
+            if not d.dimensions_present and d.drawing_type in KEY_MEASUREMENT_TYPES:
+                no_dimensions += 1
         report.drawing_types_present = list(present_types)
 
         # Check for schedules and specifications
@@ -410,7 +657,7 @@ class IntakeAnalyst:
         report.specifications_present = DrawingType.SPECIFICATION in present_types
 
         # What's required for this project type?
-        required = set(self.REQUIRED_DRAWINGS.get(self.project_type, self.REQUIRED_DRAWINGS["default"]))
+        required = self.REQUIRED_DRAWINGS.get(self.project_type, self.REQUIRED_DRAWINGS["default"])
 
         # What's missing?
         missing_types = required - present_types
@@ -422,10 +669,10 @@ class IntakeAnalyst:
 
             report.missing_items.append(MissingItem(
                 item_type="drawing",
-                description=f"{missing_type.value.replace('_', ' ').title()} drawing",
+                description=f"{missing_type.display_name} drawing",
                 severity=severity,
                 impact=impact,
-                recommendation=f"Request {missing_type.value.replace('_', ' ')} from architect",
+                recommendation=f"Request {missing_type.label} from architect",
             ))
 
         # Check metadata completeness
@@ -448,18 +695,14 @@ class IntakeAnalyst:
             ))
 
         # Check drawing quality
-        low_confidence = [d for d in drawings if d.confidence < 0.5]
         if low_confidence:
             report.warnings.append(
-                f"{len(low_confidence)} drawings have low classification confidence - manual review recommended"
+                f"{low_confidence} drawings have low classification confidence - manual review recommended"
             )
 
-        no_dimensions = [d for d in drawings if not d.dimensions_present and d.drawing_type in {
-            DrawingType.FLOOR_PLAN, DrawingType.ELEVATION, DrawingType.SECTION
-        }]
         if no_dimensions:
             report.warnings.append(
-                f"{len(no_dimensions)} key drawings appear to lack dimensions"
+                f"{no_dimensions} key drawings appear to lack dimensions"
             )
 
         # Calculate completeness percentage
@@ -495,17 +738,7 @@ class IntakeAnalyst:
 
     def _get_missing_impact(self, drawing_type: DrawingType) -> str:
         """Get impact description for missing drawing type."""
-        impacts = {
-            DrawingType.FLOOR_PLAN: "Cannot measure floor areas, partitions, doors, or internal elements",
-            DrawingType.SITE_PLAN: "Cannot measure external works, site area, or verify building position",
-            DrawingType.ELEVATION: "Cannot measure external wall areas, windows, or cladding",
-            DrawingType.SECTION: "Cannot verify floor-to-floor heights or construction build-ups",
-            DrawingType.ROOF_PLAN: "Cannot measure roof area or rainwater goods",
-            DrawingType.DEMOLITION: "Cannot identify extent of demolition works for refurbishment",
-            DrawingType.SCHEDULE: "Must count elements manually from drawings",
-            DrawingType.STRUCTURAL: "Cannot verify foundation type or structural frame",
-        }
-        return impacts.get(drawing_type, "May affect measurement accuracy")
+        return MISSING_DRAWING_IMPACTS.get(drawing_type, "May affect measurement accuracy")
 
     def _determine_scope(
         self,
@@ -515,14 +748,23 @@ class IntakeAnalyst:
         """Determine what can be measured from available drawings."""
         scope = MeasurementScope(project_id=project_id)
 
-        # Group drawings by type
+        # Group drawings by type, totalling confidence and noting which
+        # types have dimensioned drawings as we go
         by_type: dict[DrawingType, list[DrawingInfo]] = {}
+        confidence_totals: dict[DrawingType, float] = {}
+        dimensioned_types: set[DrawingType] = set()
         for d in drawings:
             if d.drawing_type not in by_type:
                 by_type[d.drawing_type] = []
+                confidence_totals[d.drawing_type] = 0.0
             by_type[d.drawing_type].append(d)
+            confidence_totals[d.drawing_type] += d.confidence
+            if d.dimensions_present:
+                dimensioned_types.add(d.drawing_type)
 
-        # Build measurable elements based on available drawings
+        # Build measurable elements based on available drawings, counting them
+        # by confidence as they are added
+        confidence_counts: Counter[str] = Counter()
         for drawing_type, type_drawings in by_type.items():
             if drawing_type == DrawingType.UNKNOWN:
                 continue
@@ -532,8 +774,8 @@ class IntakeAnalyst:
                 continue
 
             # Determine confidence based on drawing quality
-            avg_confidence = sum(d.confidence for d in type_drawings) / len(type_drawings)
-            has_dimensions = any(d.dimensions_present for d in type_drawings)
+            avg_confidence = confidence_totals[drawing_type] / len(type_drawings)
+            has_dimensions = drawing_type in dimensioned_types
 
             if avg_confidence >= 0.8 and has_dimensions:
                 confidence = "high"
@@ -553,42 +795,34 @@ class IntakeAnalyst:
             if avg_confidence < 0.7:
                 notes.append("Drawing classification confidence is moderate")
 
-            for element in potential:
-                # Map to NRM reference where possible
-                nrm_ref = self._get_nrm_reference(element)
-
-                scope.measurable_elements.append(MeasurableElement(
+            # One element per measurable item, mapped to NRM reference where possible
+            scope.measurable_elements.extend([
+                MeasurableElement(
                     element_type=element,
-                    nrm_reference=nrm_ref,
+                    nrm_reference=self._get_nrm_reference(element),
                     source_drawings=source_drawings,
                     confidence=confidence,
                     notes=notes,
-                ))
+                )
+                for element in potential
+            ])
+            confidence_counts[confidence] += len(potential)
 
         # Identify what cannot be measured
-        all_potential = set()
-        for potentials in self.MEASUREMENT_POTENTIAL.values():
-            all_potential.update(potentials)
-
         measurable = set(m.element_type for m in scope.measurable_elements)
-        unmeasurable = all_potential - measurable
-
-        for element in unmeasurable:
-            required_type = None
-            for dt, potentials in self.MEASUREMENT_POTENTIAL.items():
-                if element in potentials:
-                    required_type = dt
-                    break
 
+        for element, required_type in self.ELEMENT_DRAWING_TYPE.items():
+            if element in measurable:
+                continue
             scope.unmeasurable_elements.append({
                 "element": element,
-                "reason": f"No {required_type.value.replace('_', ' ') if required_type else 'suitable'} drawing available",
+                "reason": f"No {required_type.label} drawing available",
             })
 
         # Build summary
-        high_conf = len([m for m in scope.measurable_elements if m.confidence == "high"])
-        med_conf = len([m for m in scope.measurable_elements if m.confidence == "medium"])
-        low_conf = len([m for m in scope.measurable_elements if m.confidence == "low"])
+        high_conf = confidence_counts["high"]
+        med_conf = confidence_counts["medium"]
+        low_conf = confidence_counts["low"]
 
         scope.coverage_summary = (
             f"From {len(drawings)} drawings, {len(scope.measurable_elements)} element types can be measured: "
@@ -610,48 +844,47 @@ class IntakeAnalyst:
 
     def _get_nrm_reference(self, element: str) -> Optional[str]:
         """Map measurement element to NRM1/NRM2 reference."""
-        # Simplified mapping - would be more comprehensive in production
-        nrm_map = {
-            "Gross Internal Floor Area (GIFA)": "NRM1 2.6",
-            "Net Internal Area (NIA)": "NRM1 2.7",
-            "External wall areas": "NRM1 2.5.1",
-            "Roof area": "NRM1 2.5.2",
-            "Site area": "NRM1 2.1",
-            "Window areas and counts": "NRM2 L10/L20",
-            "Door areas and counts": "NRM2 L20",
-            "Ceiling areas": "NRM2 K10/K40",
-            "Floor construction depths": "NRM1 2.4.3",
-        }
-        return nrm_map.get(element)
+        return NRM_REFERENCES.get(element)
 
     async def _save_outputs(
         self,
         project_id: str,
-        manifest: DocumentManifest,
+        manifest_data: dict[str, Any],
         completeness: CompletenessReport,
         scope: MeasurementScope,
     ) -> None:
-        """Save output files."""
+        """Save output files, given the manifest in its to_dict() form."""
         project_dir = self.output_dir / project_id
         project_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save manifest as JSON
-        manifest_path = project_dir / "project_manifest.json"
-        with open(manifest_path, "w") as f:
-            f.write(manifest.to_json(indent=2))
-        self.logger.info(f"Saved: {manifest_path}")
-
-        # Save completeness report as Markdown
-        completeness_path = project_dir / "completeness_report.md"
-        with open(completeness_path, "w") as f:
-            f.write(completeness.to_markdown())
-        self.logger.info(f"Saved: {completeness_path}")
+        # Render and write the three files in worker threads so serialization
+        # and disk I/O don't block the event loop
+        await asyncio.gather(
+            # Manifest as JSON
+            asyncio.to_thread(
+                self._write_output,
+                project_dir / "project_manifest.json",
+                partial(dump_json, manifest_data),
+            ),
+            # Completeness report as Markdown
+            asyncio.to_thread(
+                self._write_output,
+                project_dir / "completeness_report.md",
+                completeness.to_markdown,
+            ),
+            # Measurement scope as Markdown
+            asyncio.to_thread(
+                self._write_output,
+                project_dir / "measurement_scope.md",
+                scope.to_markdown,
+            ),
+        )
 
-        # Save measurement scope as Markdown
-        scope_path = project_dir / "measurement_scope.md"
-        with open(scope_path, "w") as f:
-            f.write(scope.to_markdown())
-        self.logger.info(f"Saved: {scope_path}")
+    def _write_output(self, path: Path, render: Callable[[], str]) -> None:
+        """Render an output document and write it to path."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(render())
+        self.logger.info(f"Saved: {path}")
 
     def _create_empty_completeness(self, project_id: str) -> CompletenessReport:
         """Create empty completeness report."""
@@ -678,6 +911,8 @@ async def run_intake(
     """
     Convenience function to run intake analysis.
 
+    Runs on the caller's event loop; the CLI uses uvloop when it is installed.
+
     Args:
         input_path: Path to PDF file or directory
         project_id: Optional project identifier
@@ -694,5 +929,5 @@ async def run_intake(
         **kwargs,
     }
 
-    analyst = IntakeAnalyst(config)
-    return await analyst.analyze(input_path, project_id)
+    async with IntakeAnalyst(config) as analyst:
+        return await analyst.analyze(input_path, project_id)
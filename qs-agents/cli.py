@@ -8,6 +8,7 @@ Usage:
 Examples:
     python -m qs_agents.cli intake ./drawings/project.pdf
     python -m qs_agents.cli intake ./drawings/ --project-id ABC123 --type new_build_commercial
+    python -m qs_agents.cli intake ./project_a/ ./project_b/ ./project_c/ --workers 3
 """
 
 import argparse
@@ -32,6 +33,29 @@ def setup_logging(level: str = "INFO"):
     )
 
 
+def positive_int(value: str) -> int:
+    """argparse type for options that must be a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 async def run_intake(args):
     """Run the intake analyst agent."""
     from qs_agents.agents import IntakeAnalyst
@@ -57,115 +81,178 @@ async def run_intake(args):
     if os.environ.get("GOOGLE_API_KEY"):
         config["google_api_key"] = os.environ["GOOGLE_API_KEY"]
 
-    analyst = IntakeAnalyst(config)
+    if not args.quiet:
+        sys.stdout.write(format_intake_banner(args))
+        sys.stdout.flush()
+
+    async with IntakeAnalyst(config) as analyst:
+        if len(args.input) > 1:
+            return await run_intake_batch(analyst, args)
+
+        result = await analyst.analyze(args.input[0], args.project_id)
+
+    # Print the summary with a single write
+    if not args.quiet:
+        sys.stdout.write(format_intake_summary(result, args.output))
+        sys.stdout.flush()
 
-    print(f"\n{'=' * 60}")
-    print("QS INTAKE ANALYST")
-    print(f"{'=' * 60}")
-    print(f"Input: {args.input}")
-    print(f"Project Type: {args.type}")
-    print(f"Output Directory: {args.output}")
-    print(f"{'=' * 60}\n")
+    return 0 if result.completeness.proceed_recommendation != "hold" else 1
 
-    result = await analyst.analyze(args.input, args.project_id)
 
-    # Print summary
-    print(f"\n{'=' * 60}")
-    print("INTAKE ANALYSIS COMPLETE")
-    print(f"{'=' * 60}")
-    print(f"Project ID: {result.project_id}")
-    print(f"Processing Time: {result.processing_time_ms:.0f}ms")
-    print()
+def format_intake_banner(args) -> str:
+    """Render the start-of-run intake banner as one block of text."""
+    lines = [
+        f"\n{'=' * 60}",
+        "QS INTAKE ANALYST",
+        f"{'=' * 60}",
+        f"Input: {', '.join(args.input)}",
+        f"Project Type: {args.type}",
+        f"Output Directory: {args.output}",
+        f"{'=' * 60}\n",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def format_intake_summary(result, output: str) -> str:
+    """Render the end-of-run intake summary as one block of text."""
+    lines: list[str] = []
+    lines.append(f"\n{'=' * 60}")
+    lines.append("INTAKE ANALYSIS COMPLETE")
+    lines.append(f"{'=' * 60}")
+    lines.append(f"Project ID: {result.project_id}")
+    lines.append(f"Processing Time: {result.processing_time_ms:.0f}ms")
+    lines.append("")
 
     # Manifest summary
-    print("DOCUMENTS RECEIVED:")
-    print(f"  - Total documents: {len(result.manifest.documents)}")
-    print(f"  - Total pages: {result.manifest.total_pages}")
-    print(f"  - Total drawings: {result.manifest.total_drawings}")
-    print()
+    lines.append("DOCUMENTS RECEIVED:")
+    lines.append(f"  - Total documents: {len(result.manifest.documents)}")
+    lines.append(f"  - Total pages: {result.manifest.total_pages}")
+    lines.append(f"  - Total drawings: {result.manifest.total_drawings}")
+    lines.append("")
 
     # Metadata summary
     if result.manifest.metadata:
         m = result.manifest.metadata
-        print("PROJECT METADATA:")
+        lines.append("PROJECT METADATA:")
         if m.project_name:
-            print(f"  - Project: {m.project_name}")
+            lines.append(f"  - Project: {m.project_name}")
         if m.project_number:
-            print(f"  - Reference: {m.project_number}")
+            lines.append(f"  - Reference: {m.project_number}")
         if m.architect:
-            print(f"  - Architect: {m.architect}")
+            lines.append(f"  - Architect: {m.architect}")
         if m.location and m.location.postcode:
-            print(f"  - Location: {m.location.postcode}")
-        print()
+            lines.append(f"  - Location: {m.location.postcode}")
+        lines.append("")
 
     # Completeness summary
     c = result.completeness
-    print("COMPLETENESS ASSESSMENT:")
-    print(f"  - Status: {c.status.upper()}")
-    print(f"  - Completeness: {c.overall_completeness_pct:.0f}%")
-    print(f"  - Recommendation: {c.proceed_recommendation.upper()}")
+    lines.append("COMPLETENESS ASSESSMENT:")
+    lines.append(f"  - Status: {c.status.upper()}")
+    lines.append(f"  - Completeness: {c.overall_completeness_pct:.0f}%")
+    lines.append(f"  - Recommendation: {c.proceed_recommendation.upper()}")
     if c.hold_reasons:
-        print("  - Reasons:")
+        lines.append("  - Reasons:")
         for reason in c.hold_reasons:
-            print(f"      • {reason}")
-    print()
+            lines.append(f"      • {reason}")
+    lines.append("")
 
     # Drawing types found
     if c.drawing_types_present:
-        print("DRAWING TYPES IDENTIFIED:")
+        lines.append("DRAWING TYPES IDENTIFIED:")
         for dt in c.drawing_types_present:
-            print(f"  ✓ {dt.value.replace('_', ' ').title()}")
-        print()
+            lines.append(f"  ✓ {dt.display_name}")
+        lines.append("")
 
     # Missing items
     if c.missing_items:
-        critical = [m for m in c.missing_items if m.severity == "critical"]
-        important = [m for m in c.missing_items if m.severity == "important"]
+        by_severity = c.missing_by_severity()
+        critical = by_severity["critical"]
+        important = by_severity["important"]
 
         if critical:
-            print("CRITICAL MISSING ITEMS:")
+            lines.append("CRITICAL MISSING ITEMS:")
             for item in critical:
-                print(f"  ✗ {item.description}")
-            print()
+                lines.append(f"  ✗ {item.description}")
+            lines.append("")
 
         if important:
-            print("IMPORTANT MISSING ITEMS:")
+            lines.append("IMPORTANT MISSING ITEMS:")
             for item in important:
-                print(f"  ⚠ {item.description}")
-            print()
+                lines.append(f"  ⚠ {item.description}")
+            lines.append("")
 
     # Measurement scope summary
     s = result.measurement_scope
-    high = len([m for m in s.measurable_elements if m.confidence == "high"])
-    med = len([m for m in s.measurable_elements if m.confidence == "medium"])
-    low = len([m for m in s.measurable_elements if m.confidence == "low"])
-
-    print("MEASUREMENT SCOPE:")
-    print(f"  - Measurable elements: {len(s.measurable_elements)}")
-    print(f"      High confidence: {high}")
-    print(f"      Medium confidence: {med}")
-    print(f"      Low confidence: {low}")
-    print(f"  - Cannot be measured: {len(s.unmeasurable_elements)}")
-    print()
+    by_confidence = s.elements_by_confidence()
+    high = len(by_confidence["high"])
+    med = len(by_confidence["medium"])
+    low = len(by_confidence["low"])
+
+    lines.append("MEASUREMENT SCOPE:")
+    lines.append(f"  - Measurable elements: {len(s.measurable_elements)}")
+    lines.append(f"      High confidence: {high}")
+    lines.append(f"      Medium confidence: {med}")
+    lines.append(f"      Low confidence: {low}")
+    lines.append(f"  - Cannot be measured: {len(s.unmeasurable_elements)}")
+    lines.append("")
 
     # Warnings
     if result.warnings:
-        print("WARNINGS:")
+        lines.append("WARNINGS:")
         for warning in result.warnings[:5]:  # Show first 5
-            print(f"  ⚠ {warning}")
+            lines.append(f"  ⚠ {warning}")
         if len(result.warnings) > 5:
-            print(f"  ... and {len(result.warnings) - 5} more")
-        print()
+            lines.append(f"  ... and {len(result.warnings) - 5} more")
+        lines.append("")
 
     # Output files
-    output_dir = Path(args.output) / result.project_id
-    print("OUTPUT FILES:")
-    print(f"  - {output_dir / 'project_manifest.json'}")
-    print(f"  - {output_dir / 'completeness_report.md'}")
-    print(f"  - {output_dir / 'measurement_scope.md'}")
-    print(f"{'=' * 60}\n")
-
-    return 0 if c.proceed_recommendation != "hold" else 1
+    output_dir = Path(output) / result.project_id
+    lines.append("OUTPUT FILES:")
+    lines.append(f"  - {output_dir / 'project_manifest.json'}")
+    lines.append(f"  - {output_dir / 'completeness_report.md'}")
+    lines.append(f"  - {output_dir / 'measurement_scope.md'}")
+    lines.append(f"{'=' * 60}\n")
+
+    return "\n".join(lines) + "\n"
+
+
+async def run_intake_batch(analyst, args):
+    """Run intake over several packages concurrently and print a summary table."""
+    results = await analyst.analyze_batch(args.input, max_concurrency=args.workers)
+
+    lines = [
+        f"\n{'=' * 60}",
+        "BATCH INTAKE COMPLETE",
+        f"{'=' * 60}",
+    ]
+
+    failed = held = 0
+    for input_path, result in zip(args.input, results):
+        if isinstance(result, Exception):
+            failed += 1
+            lines.append(f"  ✗ {input_path}: failed - {result}")
+            continue
+        c = result.completeness
+        if c.proceed_recommendation == "hold":
+            held += 1
+        lines.append(
+            f"  {'⚠' if c.proceed_recommendation == 'hold' else '✓'} {input_path}: "
+            f"{result.project_id} - {c.overall_completeness_pct:.0f}% complete, "
+            f"{c.proceed_recommendation.upper()} ({result.processing_time_ms:.0f}ms)"
+        )
+
+    lines.extend([
+        "",
+        f"Projects: {len(results)}, proceed: {len(results) - failed - held}, hold: {held}, failed: {failed}",
+        f"Output Directory: {args.output}",
+        f"{'=' * 60}\n",
+    ])
+
+    if not args.quiet:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    return 0 if not failed and not held else 1
 
 
 def main():
@@ -190,12 +277,24 @@ def main():
     )
     intake_parser.add_argument(
         "input",
-        help="Path to PDF file or directory containing PDFs",
+        nargs="+",
+        help="Path to PDF file or directory containing PDFs (several paths run as separate projects)",
     )
     intake_parser.add_argument(
         "--project-id",
         dest="project_id",
-        help="Project identifier (auto-generated if not provided)",
+        help="Project identifier (auto-generated if not provided; single input only)",
+    )
+    intake_parser.add_argument(
+        "--workers", "-w",
+        type=positive_int,
+        default=4,
+        help="Projects analyzed at once when several inputs are given",
+    )
+    intake_parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Skip the printed summary (output files are still written)",
     )
     intake_parser.add_argument(
         "--output", "-o",
@@ -225,7 +324,9 @@ def main():
     setup_logging(args.log_level)
 
     if args.command == "intake":
-        return asyncio.run(run_intake(args))
+        if args.project_id and len(args.input) > 1:
+            parser.error("--project-id can only be used with a single input")
+        return run_async(run_intake(args))
 
     return 0
 
@@ -18,10 +18,21 @@ from .common import (
     CompletenessReport,
     MeasurementScope,
 )
-from .pdf_parser import PDFParser, PDFParserResult
-from .drawing_classifier import DrawingClassifier, ClassificationResult
-from .metadata_extractor import MetadataExtractor, ExtractionResult
-from .geocoder import Geocoder, GeocodingResult
+import importlib
+
+# Tool classes and the module that provides each one, imported on first
+# access (PEP 562) so using one tool does not load the others.
+_LAZY_IMPORTS = {
+    "PDFParser": ".pdf_parser",
+    "PDFParserResult": ".pdf_parser",
+    "DrawingClassifier": ".drawing_classifier",
+    "ClassificationResult": ".drawing_classifier",
+    "MetadataExtractor": ".metadata_extractor",
+    "ExtractionResult": ".metadata_extractor",
+    "PageText": ".metadata_extractor",
+    "Geocoder": ".geocoder",
+    "GeocodingResult": ".geocoder",
+}
 
 __all__ = [
     # Base
@@ -42,6 +53,22 @@ __all__ = [
     "ClassificationResult",
     "MetadataExtractor",
     "ExtractionResult",
+    "PageText",
     "Geocoder",
     "GeocodingResult",
 ]
+
+
+def __getattr__(name: str):
+    """Import a tool class from its module on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
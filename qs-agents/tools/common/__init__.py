@@ -1,23 +1,39 @@
 """Common utilities and base classes for QS Agent tools."""
 
-from .base import BaseTool, ToolResult, ToolError
+from .base import BaseTool, ToolResult, ToolError, ToolStatus
+from .cache import ResultCache, file_digest
 from .schemas import (
     DrawingType,
+    DocumentStatus,
     DrawingInfo,
+    LocationInfo,
     ProjectMetadata,
+    DocumentEntry,
     DocumentManifest,
+    MissingItem,
     CompletenessReport,
+    MeasurableElement,
     MeasurementScope,
+    dump_json,
 )
 
 __all__ = [
     "BaseTool",
     "ToolResult",
     "ToolError",
+    "ToolStatus",
+    "ResultCache",
+    "file_digest",
     "DrawingType",
+    "DocumentStatus",
     "DrawingInfo",
+    "LocationInfo",
     "ProjectMetadata",
+    "DocumentEntry",
     "DocumentManifest",
+    "MissingItem",
     "CompletenessReport",
+    "MeasurableElement",
     "MeasurementScope",
+    "dump_json",
 ]
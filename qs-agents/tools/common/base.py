@@ -1,11 +1,12 @@
 """Base classes for QS Agent tools."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Generic, TypeVar, Optional
+from typing import Any, Generic, TypeVar, Optional, Sequence
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,7 +22,7 @@ class ToolStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolError:
     """Represents an error encountered during tool execution."""
     code: str
@@ -38,7 +39,7 @@ class ToolError:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult(Generic[T]):
     """Generic result wrapper for tool outputs."""
     status: ToolStatus
@@ -55,7 +56,7 @@ class ToolResult(Generic[T]):
     def to_dict(self) -> dict[str, Any]:
         return {
             "status": self.status.value,
-            "data": self.data if not hasattr(self.data, "to_dict") else self.data.to_dict(),
+            "data": _serialize_data(self.data),
             "errors": [e.to_dict() for e in self.errors],
             "warnings": self.warnings,
             "execution_time_ms": self.execution_time_ms,
@@ -63,6 +64,15 @@ class ToolResult(Generic[T]):
         }
 
 
+def _serialize_data(data: Any) -> Any:
+    """Convert result data, or a list of results, to plain dicts where possible."""
+    if hasattr(data, "to_dict"):
+        return data.to_dict()
+    if isinstance(data, list):
+        return [item.to_dict() if hasattr(item, "to_dict") else item for item in data]
+    return data
+
+
 class BaseTool(ABC):
     """Abstract base class for all QS Agent tools."""
 
@@ -92,6 +102,30 @@ class BaseTool(ABC):
         """Execute the tool's primary function."""
         pass
 
+    async def execute_batch(
+        self,
+        items: Sequence[tuple[Any, ...]],
+        max_concurrency: int = 8,
+    ) -> list[ToolResult]:
+        """
+        Execute the tool once per item, concurrently.
+
+        Each item is a tuple of positional arguments for execute(). Results
+        are returned in item order. Override in tools whose backend can
+        process several items in a single request.
+
+        Args:
+            items: Argument tuples, one per execute() call
+            max_concurrency: Maximum number of execute() calls in flight
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def execute_one(args: tuple[Any, ...]) -> ToolResult:
+            async with semaphore:
+                return await self.execute(*args)
+
+        return await asyncio.gather(*[execute_one(args) for args in items])
+
     async def validate_input(self, *args, **kwargs) -> list[ToolError]:
         """Validate inputs before execution. Override in subclasses."""
         return []
@@ -100,6 +134,15 @@ class BaseTool(ABC):
         """Check if the tool is operational. Override for tools with dependencies."""
         return True
 
+    async def close(self) -> None:
+        """Release pooled connections. Override in tools that hold sessions."""
+
+    async def __aenter__(self) -> "BaseTool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
     def _create_error(
         self,
         code: str,
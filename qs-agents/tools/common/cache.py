@@ -0,0 +1,78 @@
+"""Persistent result cache shared by QS Agent tools."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+
+def file_digest(file_path: str | Path, *salt: str) -> str:
+    """
+    Hash a file's contents, optionally mixed with extra key material.
+
+    Args:
+        file_path: File to hash
+        salt: Extra strings (e.g. provider and model) that should change the key
+
+    Returns:
+        Hex digest identifying the file contents plus salt
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    for value in salt:
+        digest.update(b"\0")
+        digest.update(value.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk key-value store for JSON-serializable tool results.
+
+    Backed by a single SQLite file so results survive between runs. The
+    connection is opened on first use. Safe to call from worker threads;
+    access to the connection is serialized by a lock.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the cached result for key, or None on a miss."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, value: dict[str, Any]) -> None:
+        """Store a result under key, replacing any previous entry."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                (key, json.dumps(value)),
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -29,6 +29,55 @@ class DrawingType(Enum):
     LEGEND = "legend"
     UNKNOWN = "unknown"
 
+    @property
+    def label(self) -> str:
+        """Lower-case display label, e.g. "floor plan"."""
+        return _DRAWING_TYPE_LABELS[self]
+
+    @property
+    def display_name(self) -> str:
+        """Title-case display name, e.g. "Floor Plan"."""
+        return _DRAWING_TYPE_DISPLAY_NAMES[self]
+
+
+# Display strings for each drawing type, built once
+_DRAWING_TYPE_LABELS = {dt: dt.value.replace("_", " ") for dt in DrawingType}
+_DRAWING_TYPE_DISPLAY_NAMES = {dt: label.title() for dt, label in _DRAWING_TYPE_LABELS.items()}
+
+# Display strings for the report status and recommendation vocabularies
+_REPORT_DISPLAY_NAMES = {
+    value: value.replace("_", " ").title()
+    for value in ("complete", "incomplete", "critical_gaps", "proceed", "proceed_with_caution", "hold")
+}
+
+
+def _display_name(value: str) -> str:
+    """Title-case display form of a snake_case status value."""
+    name = _REPORT_DISPLAY_NAMES.get(value)
+    return name if name is not None else value.replace("_", " ").title()
+
+
+def dump_json(data: Any, indent: Optional[int] = 2) -> str:
+    """
+    Serialize to_dict() output as JSON text.
+
+    Uses orjson when it is installed and indent is 2 (the only indent it
+    supports), falling back to the standard library json module.
+    """
+    if indent == 2:
+        try:
+            import orjson
+        except ImportError:
+            pass
+        else:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str).decode("utf-8")
+    return json.dumps(data, indent=indent, default=str)
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an optional ISO timestamp written by to_dict."""
+    return datetime.fromisoformat(value) if value else None
+
 
 class DocumentStatus(Enum):
     """Status of a document in the package."""
@@ -38,7 +87,7 @@ class DocumentStatus(Enum):
     SUPERSEDED = "superseded"
 
 
-@dataclass
+@dataclass(slots=True)
 class DrawingInfo:
     """Information extracted from a single drawing."""
     file_path: str
@@ -70,12 +119,20 @@ class DrawingInfo:
             "dimensions_present": self.dimensions_present,
             "annotations_present": self.annotations_present,
             "confidence": self.confidence,
+            "image_path": self.image_path,
             "measurement_potential": self.measurement_potential,
             "notes": self.notes,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DrawingInfo":
+        data = dict(data)
+        data["drawing_type"] = DrawingType(data["drawing_type"])
+        data["revision_date"] = _parse_datetime(data.get("revision_date"))
+        return cls(**data)
+
 
-@dataclass
+@dataclass(slots=True)
 class LocationInfo:
     """Geographic location information."""
     address: Optional[str] = None
@@ -99,8 +156,16 @@ class LocationInfo:
             "what3words": self.what3words,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LocationInfo":
+        return cls(**data)
 
-@dataclass
+    def needs_enrichment(self) -> bool:
+        """Whether geocoding could still add coordinates to this location."""
+        return self.latitude is None or self.longitude is None
+
+
+@dataclass(slots=True)
 class ProjectMetadata:
     """Extracted project metadata."""
     project_name: Optional[str] = None
@@ -138,8 +203,15 @@ class ProjectMetadata:
             "raw_extracted_fields": self.raw_extracted_fields,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ProjectMetadata":
+        data = dict(data)
+        data["location"] = LocationInfo.from_dict(data["location"]) if data.get("location") else None
+        data["issue_date"] = _parse_datetime(data.get("issue_date"))
+        return cls(**data)
+
 
-@dataclass
+@dataclass(slots=True)
 class DocumentEntry:
     """Entry in the document manifest."""
     file_name: str
@@ -165,8 +237,16 @@ class DocumentEntry:
             "received_date": self.received_date.isoformat(),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DocumentEntry":
+        data = dict(data)
+        data["drawings"] = [DrawingInfo.from_dict(d) for d in data.get("drawings", [])]
+        data["status"] = DocumentStatus(data["status"])
+        data["received_date"] = datetime.fromisoformat(data["received_date"])
+        return cls(**data)
 
-@dataclass
+
+@dataclass(slots=True)
 class DocumentManifest:
     """Complete manifest of received documents - project_manifest.json output."""
     project_id: str
@@ -189,10 +269,18 @@ class DocumentManifest:
         }
 
     def to_json(self, indent: int = 2) -> str:
-        return json.dumps(self.to_dict(), indent=indent, default=str)
+        return dump_json(self.to_dict(), indent=indent)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DocumentManifest":
+        data = dict(data)
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["documents"] = [DocumentEntry.from_dict(d) for d in data.get("documents", [])]
+        data["metadata"] = ProjectMetadata.from_dict(data["metadata"]) if data.get("metadata") else None
+        return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class MissingItem:
     """An item identified as missing from the document package."""
     item_type: str  # e.g., "drawing", "specification", "schedule"
@@ -210,8 +298,12 @@ class MissingItem:
             "recommendation": self.recommendation,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MissingItem":
+        return cls(**data)
 
-@dataclass
+
+@dataclass(slots=True)
 class CompletenessReport:
     """Report on document package completeness - completeness_report.md output."""
     project_id: str
@@ -251,6 +343,23 @@ class CompletenessReport:
             "hold_reasons": self.hold_reasons,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CompletenessReport":
+        data = dict(data)
+        data["assessment_date"] = datetime.fromisoformat(data["assessment_date"])
+        data["drawing_types_present"] = [DrawingType(dt) for dt in data.get("drawing_types_present", [])]
+        data["missing_items"] = [MissingItem.from_dict(m) for m in data.get("missing_items", [])]
+        return cls(**data)
+
+    def missing_by_severity(self) -> dict[str, list[MissingItem]]:
+        """Missing items grouped by severity, in one pass."""
+        buckets: dict[str, list[MissingItem]] = {"critical": [], "important": [], "minor": []}
+        for item in self.missing_items:
+            bucket = buckets.get(item.severity)
+            if bucket is not None:
+                bucket.append(item)
+        return buckets
+
     def to_markdown(self) -> str:
         """Generate markdown report."""
         lines = [
@@ -259,18 +368,17 @@ class CompletenessReport:
             f"**Project ID:** {self.project_id}",
             f"**Assessment Date:** {self.assessment_date.strftime('%Y-%m-%d %H:%M')}",
             f"**Overall Completeness:** {self.overall_completeness_pct:.0f}%",
-            f"**Status:** {self.status.replace('_', ' ').title()}",
+            f"**Status:** {_display_name(self.status)}",
             f"",
             f"## Recommendation",
             f"",
-            f"**{self.proceed_recommendation.replace('_', ' ').title()}**",
+            f"**{_display_name(self.proceed_recommendation)}**",
             f"",
         ]
 
         if self.hold_reasons:
             lines.append("### Reasons")
-            for reason in self.hold_reasons:
-                lines.append(f"- {reason}")
+            lines.extend(f"- {reason}" for reason in self.hold_reasons)
             lines.append("")
 
         lines.extend([
@@ -280,8 +388,7 @@ class CompletenessReport:
         ])
 
         if self.drawing_types_present:
-            for dt in self.drawing_types_present:
-                lines.append(f"- ✓ {dt.value.replace('_', ' ').title()}")
+            lines.extend(f"- ✓ {dt.display_name}" for dt in self.drawing_types_present)
         else:
             lines.append("- None identified")
 
@@ -298,36 +405,26 @@ class CompletenessReport:
                 f"",
             ])
 
-            critical = [m for m in self.missing_items if m.severity == "critical"]
-            important = [m for m in self.missing_items if m.severity == "important"]
-            minor = [m for m in self.missing_items if m.severity == "minor"]
-
-            if critical:
-                lines.append("### Critical (Blocks Measurement)")
-                for item in critical:
-                    lines.extend([
-                        f"",
-                        f"**{item.description}**",
-                        f"- Impact: {item.impact}",
-                        f"- Recommendation: {item.recommendation}",
-                    ])
-                lines.append("")
-
-            if important:
-                lines.append("### Important (Affects Accuracy)")
-                for item in important:
-                    lines.extend([
-                        f"",
-                        f"**{item.description}**",
-                        f"- Impact: {item.impact}",
-                        f"- Recommendation: {item.recommendation}",
-                    ])
-                lines.append("")
-
-            if minor:
+            by_severity = self.missing_by_severity()
+
+            for severity, heading in (
+                ("critical", "### Critical (Blocks Measurement)"),
+                ("important", "### Important (Affects Accuracy)"),
+            ):
+                if by_severity[severity]:
+                    lines.append(heading)
+                    for item in by_severity[severity]:
+                        lines.extend((
+                            f"",
+                            f"**{item.description}**",
+                            f"- Impact: {item.impact}",
+                            f"- Recommendation: {item.recommendation}",
+                        ))
+                    lines.append("")
+
+            if by_severity["minor"]:
                 lines.append("### Minor (Nice to Have)")
-                for item in minor:
-                    lines.append(f"- {item.description}")
+                lines.extend(f"- {item.description}" for item in by_severity["minor"])
                 lines.append("")
 
         if self.warnings:
@@ -335,8 +432,7 @@ class CompletenessReport:
                 f"## Warnings",
                 f"",
             ])
-            for warning in self.warnings:
-                lines.append(f"⚠️ {warning}")
+            lines.extend(f"⚠️ {warning}" for warning in self.warnings)
             lines.append("")
 
         if self.notes:
@@ -344,13 +440,12 @@ class CompletenessReport:
                 f"## Notes",
                 f"",
             ])
-            for note in self.notes:
-                lines.append(f"- {note}")
+            lines.extend(f"- {note}" for note in self.notes)
 
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class MeasurableElement:
     """An element that can be measured from available drawings."""
     element_type: str  # e.g., "floor_area", "wall_length", "door_schedule"
@@ -368,8 +463,12 @@ class MeasurableElement:
             "notes": self.notes,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MeasurableElement":
+        return cls(**data)
+
 
-@dataclass
+@dataclass(slots=True)
 class MeasurementScope:
     """Scope of what can be measured - measurement_scope.md output."""
     project_id: str
@@ -397,6 +496,22 @@ class MeasurementScope:
             "exclusions": self.exclusions,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MeasurementScope":
+        data = dict(data)
+        data["assessment_date"] = datetime.fromisoformat(data["assessment_date"])
+        data["measurable_elements"] = [MeasurableElement.from_dict(m) for m in data.get("measurable_elements", [])]
+        return cls(**data)
+
+    def elements_by_confidence(self) -> dict[str, list[MeasurableElement]]:
+        """Measurable elements grouped by confidence, in one pass."""
+        buckets: dict[str, list[MeasurableElement]] = {"high": [], "medium": [], "low": []}
+        for element in self.measurable_elements:
+            bucket = buckets.get(element.confidence)
+            if bucket is not None:
+                bucket.append(element)
+        return buckets
+
     def to_markdown(self) -> str:
         """Generate markdown report."""
         lines = [
@@ -415,14 +530,17 @@ class MeasurementScope:
 
         if self.measurable_elements:
             # Group by confidence
-            high = [m for m in self.measurable_elements if m.confidence == "high"]
-            medium = [m for m in self.measurable_elements if m.confidence == "medium"]
-            low = [m for m in self.measurable_elements if m.confidence == "low"]
+            by_confidence = self.elements_by_confidence()
+            high = by_confidence["high"]
+            medium = by_confidence["medium"]
+            low = by_confidence["low"]
 
             if high:
-                lines.append("### High Confidence")
-                lines.append("| Element | NRM Ref | Source Drawings |")
-                lines.append("|---------|---------|-----------------|")
+                lines.extend((
+                    "### High Confidence",
+                    "| Element | NRM Ref | Source Drawings |",
+                    "|---------|---------|-----------------|",
+                ))
                 for elem in high:
                     sources = ", ".join(elem.source_drawings[:3])
                     if len(elem.source_drawings) > 3:
@@ -431,9 +549,11 @@ class MeasurementScope:
                 lines.append("")
 
             if medium:
-                lines.append("### Medium Confidence")
-                lines.append("| Element | NRM Ref | Notes |")
-                lines.append("|---------|---------|-------|")
+                lines.extend((
+                    "### Medium Confidence",
+                    "| Element | NRM Ref | Notes |",
+                    "|---------|---------|-------|",
+                ))
                 for elem in medium:
                     notes = "; ".join(elem.notes) if elem.notes else "-"
                     lines.append(f"| {elem.element_type} | {elem.nrm_reference or '-'} | {notes} |")
@@ -443,20 +563,20 @@ class MeasurementScope:
                 lines.append("### Low Confidence (Requires Assumptions)")
                 for elem in low:
                     lines.append(f"- **{elem.element_type}**")
-                    for note in elem.notes:
-                        lines.append(f"  - {note}")
+                    lines.extend(f"  - {note}" for note in elem.notes)
                 lines.append("")
         else:
-            lines.append("*No elements identified for measurement*")
-            lines.append("")
+            lines.extend(("*No elements identified for measurement*", ""))
 
         if self.unmeasurable_elements:
             lines.extend([
                 f"## Cannot Be Measured",
                 f"",
             ])
-            for item in self.unmeasurable_elements:
-                lines.append(f"- **{item.get('element', 'Unknown')}**: {item.get('reason', 'No reason given')}")
+            lines.extend(
+                f"- **{item.get('element', 'Unknown')}**: {item.get('reason', 'No reason given')}"
+                for item in self.unmeasurable_elements
+            )
             lines.append("")
 
         if self.recommended_assumptions:
@@ -464,8 +584,7 @@ class MeasurementScope:
                 f"## Recommended Assumptions",
                 f"",
             ])
-            for assumption in self.recommended_assumptions:
-                lines.append(f"- {assumption}")
+            lines.extend(f"- {assumption}" for assumption in self.recommended_assumptions)
             lines.append("")
 
         if self.exclusions:
@@ -473,7 +592,6 @@ class MeasurementScope:
                 f"## Exclusions",
                 f"",
             ])
-            for exclusion in self.exclusions:
-                lines.append(f"- {exclusion}")
+            lines.extend(f"- {exclusion}" for exclusion in self.exclusions)
 
         return "\n".join(lines)
@@ -1,15 +1,21 @@
 """Drawing Classifier using vision models to identify architectural drawing types."""
 
+import asyncio
 import base64
+import hashlib
+import importlib.util
 import json
+import mmap
+import os
 import re
-import subprocess
+import shutil
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional, Sequence
 
 from ..common.base import BaseTool, ToolResult, ToolStatus, ToolError
+from ..common.cache import ResultCache, file_digest
 from ..common.schemas import DrawingType, DrawingInfo
 
 
@@ -72,6 +78,20 @@ Respond in JSON format:
 }
 ```"""
 
+# Part of the classification cache key, so editing the prompt invalidates
+# results produced under the old wording
+PROMPT_VERSION = hashlib.blake2b(CLASSIFICATION_PROMPT.encode("utf-8"), digest_size=8).hexdigest()
+
+
+# Supported image extensions and the media type sent to the vision APIs
+IMAGE_MEDIA_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
 
 @dataclass
 class ClassificationResult:
@@ -102,6 +122,22 @@ class ClassificationResult:
             "notes": self.notes,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ClassificationResult":
+        """Rebuild a result from its to_dict() form."""
+        return cls(
+            drawing_type=DrawingType(data["drawing_type"]),
+            drawing_number=data.get("drawing_number"),
+            drawing_title=data.get("drawing_title"),
+            revision=data.get("revision"),
+            scale=data.get("scale"),
+            dimensions_present=data.get("dimensions_present", False),
+            annotations_present=data.get("annotations_present", False),
+            confidence=data.get("confidence", 0.0),
+            measurement_potential=data.get("measurement_potential", []),
+            notes=data.get("notes", []),
+        )
+
     def to_drawing_info(self, file_path: str, page_number: int) -> DrawingInfo:
         """Convert to DrawingInfo schema."""
         return DrawingInfo(
@@ -132,6 +168,16 @@ class DrawingClassifier(BaseTool):
 
     SUPPORTED_PROVIDERS = ["claude", "anthropic", "openai"]
 
+    # Set once `claude --version` has succeeded in this process
+    _claude_verified = False
+
+    # Grey level below which a pixel counts as ink when spotting blank pages
+    BLANK_INK_LEVEL = 200
+
+    # JSON in a fenced block, or failing that the outermost braces
+    JSON_FENCE_PATTERN = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+    JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
     def __init__(self, config: Optional[dict[str, Any]] = None):
         super().__init__(config)
         self.provider = config.get("provider", "claude") if config else "claude"
@@ -139,6 +185,40 @@ class DrawingClassifier(BaseTool):
         self.api_key = config.get("api_key") if config else None
         self._client = None
 
+        # Optional persistent cache of confident classifications, keyed by
+        # image content, provider, model and prompt version
+        cache_path = config.get("cache_path") if config else None
+        self._cache = ResultCache(cache_path) if cache_path else None
+
+        # Classify pages with identical image content within a batch only once
+        self.dedupe_images = config.get("dedupe_images", True) if config else True
+        # Opt in to also grouping visually similar pages by dHash. Such sheets
+        # can differ in their title block, so only type-level fields are shared
+        self.dedupe_phash = config.get("dedupe_phash", False) if config else False
+        self.dedupe_hash_size = config.get("dedupe_hash_size", 16) if config else 16
+
+        # Skip the vision call for pages with (almost) nothing on them
+        self.skip_blank_pages = config.get("skip_blank_pages", True) if config else True
+        self.blank_ink_ratio = config.get("blank_ink_ratio", 0.001) if config else 0.001
+
+        # Vision calls in flight at once, shared by every batch on this instance
+        self.max_concurrency = config.get("max_concurrency", 8) if config else 8
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # Large batches on the anthropic/openai providers can go through their
+        # batch APIs: cheaper, but results may take up to 24 hours
+        self.batch_mode = config.get("batch_mode", False) if config else False
+        self.batch_threshold = config.get("batch_threshold", 20) if config else 20
+        self.batch_poll_max = config.get("batch_poll_max", 60.0) if config else 60.0
+        # A job still running after this many seconds is cancelled and its
+        # images are classified with realtime calls instead
+        self.batch_timeout = config.get("batch_timeout", 3600.0) if config else 3600.0
+        self._batch_responses: dict[Path, str] = {}
+
+        # Seconds a health_check() answer is reused before probing again
+        self.health_ttl = config.get("health_ttl", 60.0) if config else 60.0
+        self._health_cache: Optional[tuple[float, bool]] = None
+
         # If no API key provided and provider is anthropic, default to claude (CLI)
         if self.provider == "anthropic" and not self.api_key:
             self.provider = "claude"
@@ -152,86 +232,137 @@ class DrawingClassifier(BaseTool):
         return "Classifies architectural drawings using vision AI to identify drawing types and extract metadata"
 
     async def health_check(self) -> bool:
-        """Check if the vision API is accessible."""
+        """Check if the vision API is accessible, reusing a recent answer."""
+        import time
+
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache[0] < self.health_ttl:
+            return self._health_cache[1]
+
+        healthy = await self._probe_provider()
+        self._health_cache = (now, healthy)
+        return healthy
+
+    async def _probe_provider(self) -> bool:
+        """Check that the configured provider can be used right now."""
         if self.provider == "claude":
-            # Check if claude CLI is available
+            # Finding the binary on PATH catches the usual "not installed" case
+            if shutil.which("claude") is None:
+                self.logger.warning("claude CLI not found or not accessible")
+                return False
+            if DrawingClassifier._claude_verified:
+                return True
+
+            # Run it once per process to confirm it actually starts
             try:
-                result = subprocess.run(
-                    ["claude", "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
+                proc = await asyncio.create_subprocess_exec(
+                    "claude", "--version",
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
                 )
-                return result.returncode == 0
-            except (subprocess.SubprocessError, FileNotFoundError):
+            except OSError:
                 self.logger.warning("claude CLI not found or not accessible")
                 return False
-        elif self.provider == "anthropic":
             try:
-                import anthropic
-                return True
-            except ImportError:
-                self.logger.warning("anthropic package not installed")
+                returncode = await asyncio.wait_for(proc.wait(), timeout=10)
+            except asyncio.TimeoutError:
+                self.logger.warning("claude CLI not found or not accessible")
                 return False
-        elif self.provider == "openai":
-            try:
-                import openai
-                return True
-            except ImportError:
-                self.logger.warning("openai package not installed")
+            finally:
+                await self._stop_process(proc)
+            DrawingClassifier._claude_verified = returncode == 0
+            return DrawingClassifier._claude_verified
+        elif self.provider in ("anthropic", "openai"):
+            # Locate the SDK without paying for importing it
+            if importlib.util.find_spec(self.provider) is None:
+                self.logger.warning(f"{self.provider} package not installed")
                 return False
+            return True
         return False
 
+    @staticmethod
+    async def _stop_process(proc: asyncio.subprocess.Process) -> None:
+        """Kill and reap a child process that is still running."""
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+
     def _get_client(self):
-        """Get or create the API client."""
+        """Get or create the async API client, which pools its connections."""
         if self._client is not None:
             return self._client
 
         if self.provider == "anthropic":
             import anthropic
-            self._client = anthropic.Anthropic(api_key=self.api_key)
+            self._client = anthropic.AsyncAnthropic(api_key=self.api_key)
         elif self.provider == "openai":
             import openai
-            self._client = openai.OpenAI(api_key=self.api_key)
+            self._client = openai.AsyncOpenAI(api_key=self.api_key)
 
         return self._client
 
+    async def close(self) -> None:
+        """Close the API client's connection pool and the classification cache."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        if self._cache is not None:
+            self._cache.close()
+
+    def _cache_key(self, image_path: Path) -> str:
+        """Key a classification by image content, provider, model and prompt."""
+        return file_digest(image_path, self.provider, self.model, PROMPT_VERSION)
+
+    def _cache_lookup(self, image_path: Path) -> tuple[str, Optional[dict[str, Any]]]:
+        """Return the cache key for an image and its cached result, if any."""
+        key = self._cache_key(image_path)
+        return key, self._cache.get(key)
+
+    def _needs_batch(self, image_path: Path) -> bool:
+        """Whether execute() would send this image to the provider."""
+        if not image_path.exists() or image_path.suffix.lower() not in IMAGE_MEDIA_TYPES:
+            return False
+        if self._cache is not None and self._cache_lookup(image_path)[1] is not None:
+            return False
+        # execute() answers blank pages itself, so don't pay to batch them
+        return not (self.skip_blank_pages and self._fast_prefilter(image_path) is not None)
+
     def _encode_image(self, image_path: Path) -> tuple[str, str]:
         """Encode image to base64 and determine media type."""
-        suffix = image_path.suffix.lower()
-        media_types = {
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".gif": "image/gif",
-            ".webp": "image/webp",
-        }
-        media_type = media_types.get(suffix, "image/png")
+        media_type = IMAGE_MEDIA_TYPES.get(image_path.suffix.lower(), "image/png")
 
+        # Encode straight from a memory map rather than reading the whole
+        # file into a bytes object first (mmap rejects empty files)
         with open(image_path, "rb") as f:
-            image_data = base64.standard_b64encode(f.read()).decode("utf-8")
+            if os.fstat(f.fileno()).st_size == 0:
+                return "", media_type
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                image_data = base64.standard_b64encode(mm).decode("ascii")
 
         return image_data, media_type
 
     def _parse_response(self, response_text: str) -> ClassificationResult:
         """Parse the model response into a ClassificationResult."""
-        # Try to extract JSON from response
-        json_match = re.search(r"```json\s*(.*?)\s*```", response_text, re.DOTALL)
-        if json_match:
+        stripped = response_text.strip()
+        if stripped.startswith("{") and stripped.endswith("}"):
+            # Bare JSON object, nothing to extract
+            json_str = stripped
+        elif json_match := self.JSON_FENCE_PATTERN.search(response_text):
             json_str = json_match.group(1)
-        else:
+        elif json_match := self.JSON_OBJECT_PATTERN.search(response_text):
             # Try to find raw JSON
-            json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-            else:
-                # Return unknown classification
-                return ClassificationResult(
-                    drawing_type=DrawingType.UNKNOWN,
-                    confidence=0.0,
-                    notes=["Failed to parse model response"],
-                    raw_response=response_text,
-                )
+            json_str = json_match.group(0)
+        else:
+            # Return unknown classification
+            return ClassificationResult(
+                drawing_type=DrawingType.UNKNOWN,
+                confidence=0.0,
+                notes=["Failed to parse model response"],
+                raw_response=response_text,
+            )
 
         try:
             data = json.loads(json_str)
@@ -279,59 +410,85 @@ class DrawingClassifier(BaseTool):
         try:
             # Use claude CLI with the image
             # The --print flag outputs only the response without interactive elements
-            result = subprocess.run(
-                [
-                    "claude",
-                    "--print",
-                    "--allowedTools", "Read",  # Allow reading the image file
-                    "-p", prompt,
-                    str(image_path),
-                ],
-                capture_output=True,
-                text=True,
-                timeout=120,  # 2 minute timeout for vision analysis
+            proc = await asyncio.create_subprocess_exec(
+                "claude",
+                "--print",
+                "--allowedTools", "Read",  # Allow reading the image file
+                "-p", prompt,
+                str(image_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 cwd=str(image_path.parent),
             )
+        except FileNotFoundError:
+            raise RuntimeError("Claude CLI not found. Ensure 'claude' is installed and in PATH.")
+
+        try:
+            # 2 minute timeout for vision analysis
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=120)
+        except asyncio.TimeoutError:
+            raise RuntimeError("Claude CLI timed out during image classification")
+        finally:
+            # Don't leave the CLI running after a timeout or cancellation
+            await self._stop_process(proc)
 
-            if result.returncode != 0:
-                raise RuntimeError(f"Claude CLI failed: {result.stderr}")
+        if proc.returncode != 0:
+            raise RuntimeError(f"Claude CLI failed: {stderr.decode(errors='replace')}")
 
-            return result.stdout
+        return stdout.decode()
 
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("Claude CLI timed out during image classification")
-        except FileNotFoundError:
-            raise RuntimeError("Claude CLI not found. Ensure 'claude' is installed and in PATH.")
+    def _anthropic_messages(self, image_path: Path) -> list[dict[str, Any]]:
+        """Build the Anthropic Messages API request for one image."""
+        image_data, media_type = self._encode_image(image_path)
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": media_type,
+                            "data": image_data,
+                        },
+                    },
+                    {
+                        "type": "text",
+                        "text": CLASSIFICATION_PROMPT,
+                    },
+                ],
+            }
+        ]
+
+    def _openai_messages(self, image_path: Path) -> list[dict[str, Any]]:
+        """Build the OpenAI Chat Completions request for one image."""
+        image_data, media_type = self._encode_image(image_path)
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": CLASSIFICATION_PROMPT,
+                    },
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:{media_type};base64,{image_data}",
+                        },
+                    },
+                ],
+            }
+        ]
 
     async def _classify_with_anthropic(self, image_path: Path) -> str:
         """Classify using Anthropic Claude Vision API directly."""
-        import anthropic
-
         client = self._get_client()
-        image_data, media_type = self._encode_image(image_path)
 
-        message = client.messages.create(
+        message = await client.messages.create(
             model=self.model,
             max_tokens=1024,
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": media_type,
-                                "data": image_data,
-                            },
-                        },
-                        {
-                            "type": "text",
-                            "text": CLASSIFICATION_PROMPT,
-                        },
-                    ],
-                }
-            ],
+            messages=self._anthropic_messages(image_path),
         )
 
         return message.content[0].text
@@ -339,32 +496,144 @@ class DrawingClassifier(BaseTool):
     async def _classify_with_openai(self, image_path: Path) -> str:
         """Classify using OpenAI GPT-4 Vision."""
         client = self._get_client()
-        image_data, media_type = self._encode_image(image_path)
 
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=self.model,
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": CLASSIFICATION_PROMPT,
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:{media_type};base64,{image_data}",
-                            },
-                        },
-                    ],
-                }
-            ],
+            messages=self._openai_messages(image_path),
             max_tokens=1024,
         )
 
         return response.choices[0].message.content
 
+    async def _poll_batch(
+        self,
+        retrieve: Callable[[], Awaitable[Any]],
+        finished: Callable[[Any], bool],
+        cancel: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Poll a provider batch job with exponential backoff until it finishes.
+
+        Raises TimeoutError, after asking the provider to cancel the job, if
+        it is still running after batch_timeout seconds.
+        """
+        import time
+
+        deadline = time.monotonic() + self.batch_timeout
+        delay = 1.0
+        while True:
+            batch = await retrieve()
+            if finished(batch):
+                return batch
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                try:
+                    await cancel()
+                except Exception as e:
+                    self.logger.warning(f"Could not cancel batch job: {e}")
+                raise TimeoutError(f"Batch job unfinished after {self.batch_timeout:.0f} s, cancelled")
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.batch_poll_max)
+
+    async def _batch_with_anthropic(self, image_paths: list[Path]) -> dict[Path, str]:
+        """Classify images in one Anthropic Message Batches job."""
+        client = self._get_client()
+        requests = [
+            {
+                "custom_id": f"page-{i}",
+                "params": {
+                    "model": self.model,
+                    "max_tokens": 1024,
+                    "messages": self._anthropic_messages(image_path),
+                },
+            }
+            for i, image_path in enumerate(image_paths)
+        ]
+
+        batch = await client.messages.batches.create(requests=requests)
+        await self._poll_batch(
+            lambda: client.messages.batches.retrieve(batch.id),
+            lambda b: b.processing_status == "ended",
+            lambda: client.messages.batches.cancel(batch.id),
+        )
+
+        return {
+            image_paths[int(entry.custom_id.removeprefix("page-"))]: entry.result.message.content[0].text
+            async for entry in await client.messages.batches.results(batch.id)
+            if entry.result.type == "succeeded"
+        }
+
+    async def _batch_with_openai(self, image_paths: list[Path]) -> dict[Path, str]:
+        """Classify images in one OpenAI Batch API job."""
+        client = self._get_client()
+        lines = [
+            json.dumps({
+                "custom_id": f"page-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": self._openai_messages(image_path),
+                    "max_tokens": 1024,
+                },
+            })
+            for i, image_path in enumerate(image_paths)
+        ]
+
+        input_file = await client.files.create(
+            file=("classify_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        batch = await self._poll_batch(
+            lambda: client.batches.retrieve(batch.id),
+            lambda b: b.status in ("completed", "failed", "expired", "cancelled"),
+            lambda: client.batches.cancel(batch.id),
+        )
+        if not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch {batch.id} {batch.status} without output")
+
+        output = (await client.files.content(batch.output_file_id)).text
+        responses: dict[Path, str] = {}
+        for line in output.splitlines():
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                index = int(entry["custom_id"].removeprefix("page-"))
+                responses[image_paths[index]] = response["body"]["choices"][0]["message"]["content"]
+        return responses
+
+    async def _prefetch_batch(self, image_paths: list[Path]) -> None:
+        """
+        Classify images through the provider's batch API ahead of execute().
+
+        Responses are held until execute() reaches each image. Images the
+        batch job fails on, or the whole batch if it cannot be submitted or
+        runs past batch_timeout, fall back to a realtime call.
+        """
+        needed = await asyncio.gather(*[
+            asyncio.to_thread(self._needs_batch, p) for p in image_paths
+        ])
+        pending = [p for p, needs in zip(image_paths, needed) if needs]
+        if not pending:
+            return
+
+        try:
+            if self.provider == "anthropic":
+                responses = await self._batch_with_anthropic(pending)
+            else:
+                responses = await self._batch_with_openai(pending)
+        except Exception as e:
+            self.logger.warning(f"Batch classification failed, using realtime calls: {e}")
+            return
+
+        self.logger.info(f"Batch job classified {len(responses)} of {len(pending)} images")
+        self._batch_responses.update(responses)
+
     async def execute(
         self,
         image_path: str | Path,
@@ -398,8 +667,7 @@ class DrawingClassifier(BaseTool):
                 )],
             )
 
-        valid_extensions = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
-        if image_path.suffix.lower() not in valid_extensions:
+        if image_path.suffix.lower() not in IMAGE_MEDIA_TYPES:
             return ToolResult(
                 status=ToolStatus.FAILED,
                 errors=[self._create_error(
@@ -409,9 +677,35 @@ class DrawingClassifier(BaseTool):
                 )],
             )
 
+        # Reuse a previous classification of identical image content. Hashing
+        # the image and the SQLite lookup run in a worker thread
+        cache_key = None
+        if self._cache is not None:
+            cache_key, cached = await asyncio.to_thread(self._cache_lookup, image_path)
+            if cached is not None:
+                return ToolResult(
+                    status=ToolStatus.SUCCESS,
+                    data=ClassificationResult.from_dict(cached),
+                    execution_time_ms=(time.time() - start_time) * 1000,
+                )
+
+        # Blank pages need no vision call
+        if self.skip_blank_pages:
+            blank = await asyncio.to_thread(self._fast_prefilter, image_path)
+            if blank is not None:
+                return ToolResult(
+                    status=ToolStatus.PARTIAL,
+                    data=blank,
+                    warnings=[f"Blank page, not sent for classification: {image_path.name}"],
+                    execution_time_ms=(time.time() - start_time) * 1000,
+                )
+
         try:
-            # Call appropriate provider
-            if self.provider == "claude":
+            # Use a response fetched by a batch job, else call the provider
+            batched = self._batch_responses.pop(image_path, None)
+            if batched is not None:
+                response_text = batched
+            elif self.provider == "claude":
                 response_text = await self._classify_with_claude(image_path)
             elif self.provider == "anthropic":
                 response_text = await self._classify_with_anthropic(image_path)
@@ -442,6 +736,8 @@ class DrawingClassifier(BaseTool):
             else:
                 status = ToolStatus.SUCCESS
                 warnings = []
+                if cache_key is not None:
+                    await asyncio.to_thread(self._cache.put, cache_key, result.to_dict())
 
             return ToolResult(
                 status=status,
@@ -463,16 +759,90 @@ class DrawingClassifier(BaseTool):
                 execution_time_ms=(time.time() - start_time) * 1000,
             )
 
+    def _fast_prefilter(self, image_path: Path) -> Optional[ClassificationResult]:
+        """
+        Recognise blank pages without calling the vision model.
+
+        A page counts as blank when almost no pixels are darker than
+        near-white. Needs Pillow; returns None when it is missing, the image
+        cannot be read, or the page has content.
+        """
+        try:
+            from PIL import Image
+        except ImportError:
+            return None
+
+        try:
+            with Image.open(image_path) as img:
+                # Full resolution: downscaling would fade thin linework
+                gray = img.convert("L")
+                histogram = gray.histogram()
+        except OSError:
+            return None
+
+        ink = sum(histogram[:self.BLANK_INK_LEVEL])
+        if ink > self.blank_ink_ratio * gray.width * gray.height:
+            return None
+
+        return ClassificationResult(
+            drawing_type=DrawingType.UNKNOWN,
+            confidence=0.0,
+            notes=["Blank page"],
+        )
+
+    def _image_fingerprint(self, image_path: str | Path) -> Optional[str]:
+        """
+        Fingerprint an image so duplicate pages can share a classification.
+
+        Hashes the exact file contents, or with dedupe_phash set uses a
+        difference hash (dHash) when Pillow is available. Returns None if
+        the image cannot be read, so it is classified on its own.
+        """
+        Image = None
+        if self.dedupe_phash:
+            try:
+                from PIL import Image
+            except ImportError:
+                pass
+
+        if Image is None:
+            try:
+                return file_digest(image_path)
+            except OSError:
+                return None
+
+        size = self.dedupe_hash_size
+        try:
+            with Image.open(image_path) as img:
+                pixels = list(img.convert("L").resize((size + 1, size), Image.Resampling.LANCZOS).getdata())
+        except OSError:
+            return None
+
+        # One bit per horizontally adjacent pixel pair: is the left one brighter?
+        bits = 0
+        for row in range(size):
+            offset = row * (size + 1)
+            for col in range(offset, offset + size):
+                bits = (bits << 1) | (pixels[col] > pixels[col + 1])
+        return f"dhash{size}:{bits:0{size * size // 4}x}"
+
     async def classify_batch(
         self,
-        image_paths: list[str | Path],
+        image_paths: Sequence[str | Path],
         source_file: Optional[str] = None,
     ) -> ToolResult[list[ClassificationResult]]:
         """
         Classify multiple drawing images.
 
+        Images are classified concurrently, at most max_concurrency at a
+        time across all batches on this classifier.
+
+        With batch_mode set on the anthropic or openai provider, batches of
+        at least batch_threshold distinct images are first submitted as a
+        single provider batch job.
+
         Args:
-            image_paths: List of paths to drawing images
+            image_paths: Paths to drawing images
             source_file: Original source file path
 
         Returns:
@@ -485,12 +855,89 @@ class DrawingClassifier(BaseTool):
         errors: list[ToolError] = []
         warnings: list[str] = []
 
-        for i, image_path in enumerate(image_paths):
-            result = await self.execute(
-                image_path,
-                source_file=source_file,
-                page_number=i + 1,
-            )
+        image_keys: list[Optional[str]] = [None] * len(image_paths)
+        if self.dedupe_images:
+            image_keys = await asyncio.gather(*[
+                asyncio.to_thread(self._image_fingerprint, p) for p in image_paths
+            ])
+
+        # Pages with the same fingerprint form one group, classified once
+        groups: list[list[int]] = []
+        groups_by_key: dict[str, list[int]] = {}
+        for i, image_key in enumerate(image_keys):
+            if image_key is None:
+                groups.append([i])
+            elif image_key in groups_by_key:
+                groups_by_key[image_key].append(i)
+            else:
+                groups_by_key[image_key] = [i]
+                groups.append(groups_by_key[image_key])
+
+        outcomes: list[Optional[ToolResult[ClassificationResult]]] = [None] * len(image_paths)
+        # Page index -> index of the duplicate page whose result it shares
+        shared_with: dict[int, int] = {}
+
+        async def classify_group(indices: list[int]) -> None:
+            # Try pages in order until one classifies, then share that result
+            classified = None
+            for i in indices:
+                if classified is not None:
+                    shared_with[i] = classified
+                    continue
+                async with self._semaphore:
+                    outcome = await self.execute(
+                        image_paths[i],
+                        source_file=source_file,
+                        page_number=i + 1,
+                    )
+                outcomes[i] = outcome
+                if outcome.success and outcome.data:
+                    classified = i
+
+        batched_paths: list[Path] = []
+        if (
+            self.batch_mode
+            and self.provider in ("anthropic", "openai")
+            and len(groups) >= self.batch_threshold
+        ):
+            batched_paths = [Path(image_paths[g[0]]) for g in groups]
+            await self._prefetch_batch(batched_paths)
+
+        try:
+            await asyncio.gather(*[classify_group(g) for g in groups])
+        finally:
+            # Drop batch responses execute() never consumed
+            for path in batched_paths:
+                self._batch_responses.pop(path, None)
+
+        for i, result in enumerate(outcomes):
+            if i in shared_with:
+                original = shared_with[i]
+                if image_keys[i].startswith("dhash"):
+                    # Only similar: the title block may differ, so keep just
+                    # the drawing type and what can be measured from it
+                    results.append(replace(
+                        results[original],
+                        drawing_number=None,
+                        drawing_title=None,
+                        revision=None,
+                        scale=None,
+                        measurement_potential=list(results[original].measurement_potential),
+                        notes=[
+                            f"Drawing type shared with visually similar page {original + 1}; "
+                            "title block not read"
+                        ],
+                        raw_response=None,
+                    ))
+                else:
+                    results.append(replace(
+                        results[original],
+                        measurement_potential=list(results[original].measurement_potential),
+                        notes=results[original].notes + [
+                            f"Classification shared with identical page {original + 1}"
+                        ],
+                    ))
+                continue
 
             if result.success and result.data:
                 results.append(result.data)
@@ -505,6 +952,12 @@ class DrawingClassifier(BaseTool):
 
             warnings.extend(result.warnings)
 
+        reused = len(shared_with)
+        if reused:
+            self.logger.info(
+                f"Reused classifications for {reused} of {len(image_paths)} duplicate pages"
+            )
+
         execution_time = (time.time() - start_time) * 1000
 
         return ToolResult(
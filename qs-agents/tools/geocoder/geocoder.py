@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from ..common.base import BaseTool, ToolResult, ToolStatus, ToolError
+from ..common.cache import ResultCache
 from ..common.schemas import LocationInfo
 
 
@@ -23,6 +24,15 @@ class GeocodingResult:
             "match_quality": self.match_quality,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "GeocodingResult":
+        """Rebuild a result from its to_dict() form."""
+        return cls(
+            location=LocationInfo.from_dict(data["location"]),
+            source=data["source"],
+            match_quality=data.get("match_quality", "exact"),
+        )
+
 
 class Geocoder(BaseTool):
     """
@@ -45,6 +55,12 @@ class Geocoder(BaseTool):
         self.primary_provider = config.get("provider", "postcodes_io") if config else "postcodes_io"
         self.google_api_key = config.get("google_api_key") if config else None
         self.cache: dict[str, GeocodingResult] = {}
+        # Optional on-disk cache so lookups survive between runs
+        cache_path = config.get("cache_path") if config else None
+        self._disk_cache = ResultCache(cache_path) if cache_path else None
+        # One HTTP session reused across lookups, opened on first request
+        self.max_connections = config.get("max_connections", 16) if config else 16
+        self._session = None
 
     @property
     def name(self) -> str:
@@ -54,6 +70,24 @@ class Geocoder(BaseTool):
     def description(self) -> str:
         return "Geocodes addresses and postcodes to coordinates and regional information"
 
+    def _get_session(self):
+        """Return the shared HTTP session, creating it on first use."""
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session and on-disk cache."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
     def _normalize_postcode(self, postcode: str) -> Optional[str]:
         """Normalize UK postcode to standard format."""
         postcode = postcode.strip().upper()
@@ -68,44 +102,40 @@ class Geocoder(BaseTool):
 
     async def _geocode_postcodes_io(self, postcode: str) -> GeocodingResult:
         """Geocode UK postcode using postcodes.io API."""
-        import aiohttp
-
         normalized = self._normalize_postcode(postcode)
         if not normalized:
             raise ValueError(f"Invalid UK postcode format: {postcode}")
 
         url = f"https://api.postcodes.io/postcodes/{normalized.replace(' ', '')}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 404:
-                    raise ValueError(f"Postcode not found: {normalized}")
-                elif response.status != 200:
-                    raise RuntimeError(f"Postcodes.io API error: {response.status}")
-
-                data = await response.json()
-                result = data.get("result", {})
-
-                location = LocationInfo(
-                    postcode=normalized,
-                    latitude=result.get("latitude"),
-                    longitude=result.get("longitude"),
-                    local_authority=result.get("admin_district"),
-                    region=result.get("region"),
-                    country=result.get("country", "UK"),
-                )
+        session = self._get_session()
+        async with session.get(url) as response:
+            if response.status == 404:
+                raise ValueError(f"Postcode not found: {normalized}")
+            elif response.status != 200:
+                raise RuntimeError(f"Postcodes.io API error: {response.status}")
+
+            data = await response.json()
+            result = data.get("result", {})
+
+            location = LocationInfo(
+                postcode=normalized,
+                latitude=result.get("latitude"),
+                longitude=result.get("longitude"),
+                local_authority=result.get("admin_district"),
+                region=result.get("region"),
+                country=result.get("country", "UK"),
+            )
 
-                return GeocodingResult(
-                    location=location,
-                    source="postcodes.io",
-                    raw_response=result,
-                    match_quality="exact",
-                )
+            return GeocodingResult(
+                location=location,
+                source="postcodes.io",
+                raw_response=result,
+                match_quality="exact",
+            )
 
     async def _geocode_nominatim(self, address: str) -> GeocodingResult:
         """Geocode address using OpenStreetMap Nominatim."""
-        import aiohttp
-
         url = "https://nominatim.openstreetmap.org/search"
         params = {
             "q": address,
@@ -118,49 +148,47 @@ class Geocoder(BaseTool):
             "User-Agent": "QS-Agent-Geocoder/1.0",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status != 200:
-                    raise RuntimeError(f"Nominatim API error: {response.status}")
+        session = self._get_session()
+        async with session.get(url, params=params, headers=headers) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Nominatim API error: {response.status}")
 
-                data = await response.json()
+            data = await response.json()
 
-                if not data:
-                    raise ValueError(f"Address not found: {address}")
+            if not data:
+                raise ValueError(f"Address not found: {address}")
 
-                result = data[0]
-                address_parts = result.get("address", {})
+            result = data[0]
+            address_parts = result.get("address", {})
 
-                location = LocationInfo(
-                    address=result.get("display_name"),
-                    postcode=address_parts.get("postcode"),
-                    latitude=float(result.get("lat")),
-                    longitude=float(result.get("lon")),
-                    local_authority=address_parts.get("city") or address_parts.get("town"),
-                    region=address_parts.get("county") or address_parts.get("state"),
-                    country=address_parts.get("country", "UK"),
-                )
-
-                # Determine match quality
-                match_type = result.get("type", "")
-                if match_type in ("house", "building", "address"):
-                    quality = "exact"
-                elif match_type in ("street", "road"):
-                    quality = "partial"
-                else:
-                    quality = "approximate"
+            location = LocationInfo(
+                address=result.get("display_name"),
+                postcode=address_parts.get("postcode"),
+                latitude=float(result.get("lat")),
+                longitude=float(result.get("lon")),
+                local_authority=address_parts.get("city") or address_parts.get("town"),
+                region=address_parts.get("county") or address_parts.get("state"),
+                country=address_parts.get("country", "UK"),
+            )
 
-                return GeocodingResult(
-                    location=location,
-                    source="nominatim",
-                    raw_response=result,
-                    match_quality=quality,
-                )
+            # Determine match quality
+            match_type = result.get("type", "")
+            if match_type in ("house", "building", "address"):
+                quality = "exact"
+            elif match_type in ("street", "road"):
+                quality = "partial"
+            else:
+                quality = "approximate"
+
+            return GeocodingResult(
+                location=location,
+                source="nominatim",
+                raw_response=result,
+                match_quality=quality,
+            )
 
     async def _geocode_google(self, address: str) -> GeocodingResult:
         """Geocode address using Google Maps Geocoding API."""
-        import aiohttp
-
         if not self.google_api_key:
             raise ValueError("Google API key not configured")
 
@@ -171,53 +199,53 @@ class Geocoder(BaseTool):
             "region": "gb",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status != 200:
-                    raise RuntimeError(f"Google API error: {response.status}")
-
-                data = await response.json()
-
-                if data.get("status") != "OK":
-                    raise ValueError(f"Geocoding failed: {data.get('status')}")
-
-                result = data["results"][0]
-                geometry = result.get("geometry", {})
-                location_data = geometry.get("location", {})
-
-                # Extract address components
-                components = {
-                    c["types"][0]: c["long_name"]
-                    for c in result.get("address_components", [])
-                    if c.get("types")
-                }
-
-                location = LocationInfo(
-                    address=result.get("formatted_address"),
-                    postcode=components.get("postal_code"),
-                    latitude=location_data.get("lat"),
-                    longitude=location_data.get("lng"),
-                    local_authority=components.get("postal_town") or components.get("locality"),
-                    region=components.get("administrative_area_level_2"),
-                    country=components.get("country", "UK"),
-                )
+        session = self._get_session()
+        async with session.get(url, params=params) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Google API error: {response.status}")
+
+            data = await response.json()
+
+            if data.get("status") != "OK":
+                raise ValueError(f"Geocoding failed: {data.get('status')}")
+
+            result = data["results"][0]
+            geometry = result.get("geometry", {})
+            location_data = geometry.get("location", {})
+
+            # Extract address components
+            components = {
+                c["types"][0]: c["long_name"]
+                for c in result.get("address_components", [])
+                if c.get("types")
+            }
+
+            location = LocationInfo(
+                address=result.get("formatted_address"),
+                postcode=components.get("postal_code"),
+                latitude=location_data.get("lat"),
+                longitude=location_data.get("lng"),
+                local_authority=components.get("postal_town") or components.get("locality"),
+                region=components.get("administrative_area_level_2"),
+                country=components.get("country", "UK"),
+            )
 
-                # Determine match quality from location_type
-                loc_type = geometry.get("location_type", "")
-                quality_map = {
-                    "ROOFTOP": "exact",
-                    "RANGE_INTERPOLATED": "partial",
-                    "GEOMETRIC_CENTER": "approximate",
-                    "APPROXIMATE": "approximate",
-                }
-                quality = quality_map.get(loc_type, "approximate")
-
-                return GeocodingResult(
-                    location=location,
-                    source="google",
-                    raw_response=result,
-                    match_quality=quality,
-                )
+            # Determine match quality from location_type
+            loc_type = geometry.get("location_type", "")
+            quality_map = {
+                "ROOFTOP": "exact",
+                "RANGE_INTERPOLATED": "partial",
+                "GEOMETRIC_CENTER": "approximate",
+                "APPROXIMATE": "approximate",
+            }
+            quality = quality_map.get(loc_type, "approximate")
+
+            return GeocodingResult(
+                location=location,
+                source="google",
+                raw_response=result,
+                match_quality=quality,
+            )
 
     async def execute(
         self,
@@ -249,12 +277,22 @@ class Geocoder(BaseTool):
                 )],
             )
 
-        # Check cache
-        cache_key = f"{query.lower()}:{provider or self.primary_provider}"
-        if cache_key in self.cache:
+        # Check cache. UK postcodes always go to postcodes.io, so key them
+        # by normalized postcode regardless of spacing, case or provider
+        postcode = self._normalize_postcode(query)
+        if postcode:
+            cache_key = f"{postcode}:postcodes_io"
+        else:
+            cache_key = f"{query.lower()}:{provider or self.primary_provider}"
+        cached = self.cache.get(cache_key)
+        if cached is None and self._disk_cache is not None:
+            stored = self._disk_cache.get(cache_key)
+            if stored is not None:
+                cached = self.cache[cache_key] = GeocodingResult.from_dict(stored)
+        if cached is not None:
             return ToolResult(
                 status=ToolStatus.SUCCESS,
-                data=self.cache[cache_key],
+                data=cached,
                 execution_time_ms=(time.time() - start_time) * 1000,
             )
 
@@ -295,6 +333,8 @@ class Geocoder(BaseTool):
 
             # Cache result
             self.cache[cache_key] = result
+            if self._disk_cache is not None:
+                self._disk_cache.put(cache_key, result.to_dict())
 
             execution_time = (time.time() - start_time) * 1000
 
@@ -356,31 +396,29 @@ class Geocoder(BaseTool):
             )
 
         try:
-            import aiohttp
-
             url = f"https://api.postcodes.io/postcodes/{normalized.replace(' ', '')}/validate"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        return ToolResult(
-                            status=ToolStatus.FAILED,
-                            errors=[self._create_error(
-                                "API_ERROR",
-                                f"Validation API error: {response.status}",
-                                recoverable=True,
-                            )],
-                        )
-
-                    data = await response.json()
-                    is_valid = data.get("result", False)
-
+            session = self._get_session()
+            async with session.get(url) as response:
+                if response.status != 200:
                     return ToolResult(
-                        status=ToolStatus.SUCCESS,
-                        data=is_valid,
-                        execution_time_ms=(time.time() - start_time) * 1000,
+                        status=ToolStatus.FAILED,
+                        errors=[self._create_error(
+                            "API_ERROR",
+                            f"Validation API error: {response.status}",
+                            recoverable=True,
+                        )],
                     )
 
+                data = await response.json()
+                is_valid = data.get("result", False)
+
+                return ToolResult(
+                    status=ToolStatus.SUCCESS,
+                    data=is_valid,
+                    execution_time_ms=(time.time() - start_time) * 1000,
+                )
+
         except Exception as e:
             return ToolResult(
                 status=ToolStatus.FAILED,
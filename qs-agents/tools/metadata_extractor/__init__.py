@@ -1,5 +1,5 @@
 """Metadata Extractor tool for extracting project information from documents."""
 
-from .extractor import MetadataExtractor, ExtractionResult
+from .extractor import MetadataExtractor, ExtractionResult, PageText
 
-__all__ = ["MetadataExtractor", "ExtractionResult"]
+__all__ = ["MetadataExtractor", "ExtractionResult", "PageText"]
@@ -4,12 +4,19 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional, Sequence, Union
 
 from ..common.base import BaseTool, ToolResult, ToolStatus, ToolError
 from ..common.schemas import ProjectMetadata, LocationInfo
 
 
+class PageText(NamedTuple):
+    """Text of a single document page passed to extract_from_pages."""
+    text: str
+    page_number: int
+    source: str
+
+
 @dataclass
 class ExtractionResult:
     """Result of metadata extraction."""
@@ -414,13 +421,13 @@ class MetadataExtractor(BaseTool):
 
     async def extract_from_pages(
         self,
-        pages: list[dict[str, Any]],
+        pages: Sequence[Union[PageText, dict[str, Any]]],
     ) -> ToolResult[ExtractionResult]:
         """
         Extract metadata from multiple page texts, merging results.
 
         Args:
-            pages: List of dicts with 'text' and optionally 'page_number'
+            pages: PageText tuples, or dicts with 'text' and optionally 'page_number'
 
         Returns:
             ToolResult containing merged ExtractionResult
@@ -438,15 +445,13 @@ class MetadataExtractor(BaseTool):
                 )],
             )
 
+        texts = [p.text if isinstance(p, PageText) else p.get("text", "") for p in pages]
+
         # Combine text from all pages
-        combined_text = "\n\n".join(
-            p.get("text", "") for p in pages if p.get("text")
-        )
+        combined_text = "\n\n".join(t for t in texts if t)
 
         # Also try to find metadata in first few pages (title blocks)
-        priority_text = "\n\n".join(
-            p.get("text", "") for p in pages[:3] if p.get("text")
-        )
+        priority_text = "\n\n".join(t for t in texts[:3] if t)
 
         # Extract from priority pages first
         result = await self.execute(
@@ -2,6 +2,7 @@
 
 import hashlib
 import io
+import json
 import os
 import tempfile
 from dataclasses import dataclass, field
@@ -12,6 +13,9 @@ from typing import Any, Optional
 from ..common.base import BaseTool, ToolResult, ToolStatus, ToolError
 from ..common.schemas import DocumentEntry, DocumentStatus
 
+# Formats PyMuPDF writes natively; anything else is saved through Pillow
+PIXMAP_FORMATS = frozenset({"png", "pnm", "pgm", "ppm", "pbm", "pam", "psd", "ps"})
+
 
 @dataclass
 class PageContent:
@@ -37,6 +41,10 @@ class PageContent:
             "extracted_image_path": self.extracted_image_path,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PageContent":
+        return cls(**data)
+
 
 @dataclass
 class PDFParserResult:
@@ -66,6 +74,12 @@ class PDFParserResult:
             "extraction_quality": self.extraction_quality,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PDFParserResult":
+        data = dict(data)
+        data["pages"] = [PageContent.from_dict(p) for p in data.get("pages", [])]
+        return cls(**data)
+
     def to_document_entry(self) -> DocumentEntry:
         """Convert to DocumentEntry for manifest."""
         return DocumentEntry(
@@ -93,6 +107,12 @@ class PDFParser(BaseTool):
         self.extract_images = config.get("extract_images", True) if config else True
         self.image_dpi = config.get("image_dpi", 150) if config else 150
         self.image_format = config.get("image_format", "png") if config else "png"
+        # Quality for lossy formats (webp/jpeg), which are written via Pillow
+        self.image_quality = config.get("image_quality", 85) if config else 85
+        # Longest rendered edge in pixels; large sheets drop below image_dpi
+        self.image_max_edge = config.get("image_max_edge") if config else None
+        # Reuse a previous parse (and its page images) when the PDF is unchanged
+        self.reuse_parsed = config.get("reuse_parsed", True) if config else True
         self._fitz = None
         self._pdf2image = None
 
@@ -128,12 +148,73 @@ class PDFParser(BaseTool):
 
     def _calculate_md5(self, file_path: Path) -> str:
         """Calculate MD5 hash of a file."""
-        hash_md5 = hashlib.md5()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "md5").hexdigest()
+            hash_md5 = hashlib.md5()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
                 hash_md5.update(chunk)
         return hash_md5.hexdigest()
 
+    def _fingerprint(self, file_path: Path, extract_images: bool) -> dict[str, Any]:
+        """Identify a PDF version and the settings its parse was made with."""
+        stat = file_path.stat()
+        return {
+            "file_path": str(file_path),
+            "file_size_bytes": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "extract_images": extract_images,
+            "image_dpi": self.image_dpi,
+            "image_format": self.image_format,
+            "image_quality": self.image_quality,
+            "image_max_edge": self.image_max_edge,
+        }
+
+    def _sidecar_path(self, file_path: Path, output_dir: Path) -> Path:
+        """Location of the saved parse for a PDF within the output directory."""
+        return output_dir / f"{file_path.stem}.parsed.json"
+
+    def _load_parsed(
+        self,
+        sidecar: Path,
+        fingerprint: dict[str, Any],
+    ) -> Optional[tuple[PDFParserResult, list[str]]]:
+        """
+        Load a saved parse if it matches the fingerprint and its images exist.
+
+        Returns:
+            Tuple of (result, warnings), or None if the parse must be redone
+        """
+        try:
+            saved = json.loads(sidecar.read_text(encoding="utf-8"))
+            if saved.get("fingerprint") != fingerprint:
+                return None
+            result = PDFParserResult.from_dict(saved["result"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        for page in result.pages:
+            if page.extracted_image_path and not os.path.exists(page.extracted_image_path):
+                return None
+        return result, saved.get("warnings", [])
+
+    def _save_parsed(
+        self,
+        sidecar: Path,
+        fingerprint: dict[str, Any],
+        result: PDFParserResult,
+        warnings: list[str],
+    ) -> None:
+        """Save a parse so an unchanged PDF can skip re-rendering next time."""
+        try:
+            sidecar.write_text(json.dumps({
+                "fingerprint": fingerprint,
+                "result": result.to_dict(),
+                "warnings": warnings,
+            }), encoding="utf-8")
+        except OSError as e:
+            self.logger.warning(f"Could not save parse cache {sidecar}: {e}")
+
     def _extract_page_image(
         self,
         page,
@@ -144,14 +225,22 @@ class PDFParser(BaseTool):
         """Extract a page as an image for vision processing."""
         fitz = self._ensure_fitz()
         try:
-            # Render page to image
-            mat = fitz.Matrix(self.image_dpi / 72, self.image_dpi / 72)
-            pix = page.get_pixmap(matrix=mat)
+            # Render page to image, capping the longest edge if configured
+            zoom = self.image_dpi / 72
+            if self.image_max_edge:
+                longest_pt = max(page.rect.width, page.rect.height)
+                zoom = min(zoom, self.image_max_edge / longest_pt)
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
 
             # Save image
             image_filename = f"{file_stem}_page_{page_number:03d}.{self.image_format}"
             image_path = output_dir / image_filename
-            pix.save(str(image_path))
+            if self.image_format.lower() in PIXMAP_FORMATS:
+                pix.save(str(image_path))
+            else:
+                # Lossy formats such as WebP go through Pillow
+                pil_format = "JPEG" if self.image_format.lower() == "jpg" else self.image_format.upper()
+                pix.pil_save(str(image_path), format=pil_format, quality=self.image_quality)
 
             return str(image_path)
         except Exception as e:
@@ -238,6 +327,21 @@ class PDFParser(BaseTool):
 
         output_path.mkdir(parents=True, exist_ok=True)
 
+        # Skip parsing and rendering entirely if this PDF is unchanged
+        fingerprint = sidecar = None
+        if self.reuse_parsed:
+            fingerprint = self._fingerprint(file_path, should_extract)
+            sidecar = self._sidecar_path(file_path, output_path)
+            cached = self._load_parsed(sidecar, fingerprint)
+            if cached is not None:
+                result, warnings = cached
+                return ToolResult(
+                    status=ToolStatus.SUCCESS if not warnings else ToolStatus.PARTIAL,
+                    data=result,
+                    warnings=warnings,
+                    execution_time_ms=(time.time() - start_time) * 1000,
+                )
+
         fitz = self._ensure_fitz()
 
         try:
@@ -329,6 +433,9 @@ class PDFParser(BaseTool):
                 extraction_quality=extraction_quality,
             )
 
+            if sidecar is not None:
+                self._save_parsed(sidecar, fingerprint, result, warnings)
+
             execution_time = (time.time() - start_time) * 1000
 
             return ToolResult(